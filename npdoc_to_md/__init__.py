@@ -4,4 +4,22 @@ Automatic documentation tool using Markdown and Python docstrings written in num
 See documentation in the wiki folder at the root of the repo or go to https://github.com/ThibTrip/npdoc_to_md/wiki
 """
 from npdoc_to_md._version import __version__
-from npdoc_to_md.core import RenderedFile, RenderedFileCLI, RenderedFilesCLI, render_obj_docstring, render_string, render_file, render_folder
\ No newline at end of file
+
+# objects of the module `npdoc_to_md.core` exposed at the top level of the library
+__all__ = ['RenderedFile', 'RenderedFileCLI', 'RenderedFilesCLI', 'render_obj_docstring',
+           'render_string', 'render_file', 'render_folder']
+
+
+# importing the module `core` also imports numpydoc and all the parsers which is slow.
+# We defer this until one of its objects is actually accessed (PEP 562)
+def __getattr__(name:str):
+    if name in __all__:
+        from npdoc_to_md import core
+        obj = getattr(core, name)
+        globals()[name] = obj  # so this function is not called again for this name
+        return obj
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
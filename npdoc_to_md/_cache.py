@@ -0,0 +1,152 @@
+"""
+Optional disk cache for the docstrings rendered in Markdown.
+
+It is disabled by default. To enable it either:
+* set the environment variable "NPDOC_TO_MD_CACHE" to "1" (the cache will be
+  in the folder ".npdoc_to_md_cache" of the current working directory)
+* or set the environment variable "NPDOC_TO_MD_CACHE_DIR" to the path of a folder
+  (it will be created if it does not exist)
+
+This is mostly useful for repeated documentation builds (e.g. in CI) where most
+objects did not change since the last build.
+
+The key of a cached rendering is a hash of the namespace of the object,
+the configuration used for the rendering, the docstring of the object,
+the path and modification time of its source file and the version of npdoc_to_md.
+When rendering an object with members, the object and each member are cached
+separately (see `npdoc_to_md.parsers.parse_and_render`) so that changes in the
+docstrings of the members (which may be inherited from other files) are taken into account.
+Renderings are stored in the subfolder "npdoc_to_md" of the cache folder (this is
+the only subfolder that is deleted when clearing the cache so the cache folder can
+be shared with other tools) and then in subfolders named after the first two
+characters of their key so that no folder gets too many files.
+"""
+import hashlib
+import inspect
+import os
+import pickle
+import shutil
+import sys
+from dataclasses import astuple
+from pathlib import Path
+from typing import Optional
+
+# local imports
+from npdoc_to_md._version import __version__
+from npdoc_to_md.config import Config
+from npdoc_to_md.helpers import locate
+
+
+# # Helpers
+
+# +
+cache_dir_env_var = 'NPDOC_TO_MD_CACHE_DIR'
+cache_switch_env_var = 'NPDOC_TO_MD_CACHE'
+default_cache_dir = '.npdoc_to_md_cache'
+# subfolder of the cache folder where the library stores its renderings
+cache_subdir = 'npdoc_to_md'
+
+
+def get_cache_dir() -> Optional[Path]:
+    """
+    Returns the folder of the disk cache or None if the cache is disabled
+    (see module docstring)
+    """
+    cache_dir = os.environ.get(cache_dir_env_var)
+    if cache_dir:
+        return Path(cache_dir)
+    if os.environ.get(cache_switch_env_var) == '1':
+        return Path(default_cache_dir)
+    return None
+
+
+def _get_object_info(obj_namespace:str) -> tuple:
+    """
+    Returns the docstring of the object at given namespace and the path and
+    modification time of its source file. Values that cannot be determined
+    (e.g. source file of builtins) are None. Errors when loading the object
+    are left to the rendering.
+    """
+    try:
+        obj = locate(obj_namespace)
+    except Exception:
+        return None, None, None
+    docstring = getattr(obj, '__doc__', None)
+    docstring = docstring if isinstance(docstring, str) else None
+    try:
+        sourcefile = inspect.getsourcefile(obj)
+        return docstring, sourcefile, os.path.getmtime(sourcefile)
+    except Exception:
+        return docstring, None, None
+
+
+def _get_filepath(cache_dir:Path, key:str) -> Path:
+    """
+    Returns the path of the file for given key e.g. "<cache_dir>/npdoc_to_md/a6/97301ff0b739dfcb65d51c89a47b3b"
+    """
+    return cache_dir / cache_subdir / key[:2] / key[2:]
+
+
+# -
+
+# # Main functions
+
+# +
+def make_key(obj_namespace:str, config:Config) -> str:
+    """
+    Returns the key of the cached rendering for given object and configuration.
+
+    Examples
+    --------
+    >>> key = make_key('npdoc_to_md.helpers.unique', config=Config())
+    >>> len(key)
+    32
+    """
+    data = (obj_namespace, astuple(config), *_get_object_info(obj_namespace),
+            __version__, sys.version_info[:2])
+    # fixed protocol so the same data always gives the same key
+    return hashlib.blake2b(pickle.dumps(data, protocol=4), digest_size=16).hexdigest()
+
+
+def get(key:str) -> Optional[str]:
+    """
+    Returns the rendering cached with given key or None if it is not in the cache
+    or if the cache is disabled
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        return _get_filepath(cache_dir=cache_dir, key=key).read_bytes().decode('utf-8')
+    except FileNotFoundError:
+        return None
+
+
+def put(key:str, value:str) -> None:
+    """
+    Saves given rendering in the cache (does nothing if the cache is disabled)
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return
+    filepath = _get_filepath(cache_dir=cache_dir, key=key)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    # write in a temporary file first so that other processes never read
+    # a partially written file
+    tmp_filepath = filepath.with_name(f'{filepath.name}.{os.getpid()}.tmp')
+    tmp_filepath.write_bytes(value.encode('utf-8'))
+    os.replace(tmp_filepath, filepath)
+
+
+def clear() -> None:
+    """
+    Deletes the renderings saved in the cache (does nothing if the cache is disabled).
+    Only the subfolder created by the library is deleted, the cache folder itself
+    and anything else it contains are kept.
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return
+    data_dir = cache_dir / cache_subdir
+    if data_dir.exists():
+        shutil.rmtree(data_dir)
@@ -4,7 +4,8 @@ as well as placeholders in template files
 """
 from dataclasses import dataclass, field as dataclass_field, fields as dataclass_fields, MISSING
 from enum import Enum
-from typing import get_type_hints, List, Optional
+from types import MappingProxyType
+from typing import get_type_hints, Optional, Tuple
 
 # # Helpers
 
@@ -64,28 +65,30 @@ class Config:
     remove_doctest_skip:bool = False
     md_section_level:int = 3
     ignore_custom_section_warning:bool = False
-    members:List[str] = dataclass_field(default_factory=list)
+    # a list or a tuple can be passed but it is always stored as a tuple so that
+    # instances are immutable and hashable (they are used as keys for caching)
+    members:Tuple[str, ...] = dataclass_field(default_factory=tuple)
 
     def __post_init__(self):
-        # verify types
-        config_types = get_type_hints(Config)
-        for field in dataclass_fields(self):
-            attr = field.name
+        # verify types (see `config_field_types` below the class)
+        for attr, expected_type in config_field_types:
             val = getattr(self, attr)
             type_ = type(val)
 
-            # handle special cases (non primitives e.g. List[str])
+            # handle special cases (non primitives e.g. Tuple[str, ...])
             if attr == 'alias':
                 if not isinstance(val, str) and val is not None:
                     raise TypeError(f'Parameter "{attr}" is not a str or None. Type: {type_}')
             elif attr == 'members':
-                if not isinstance(val, list):
-                    raise TypeError(f'Parameter "{attr}" is not a list. Type: {type_}')
+                if not isinstance(val, (list, tuple)):
+                    raise TypeError(f'Parameter "{attr}" is not a list or a tuple. Type: {type_}')
                 elif any(not isinstance(v, str) for v in val):
                     raise TypeError(f'The parameter "{attr}" (list) contains non strings.')
+                # copy in a tuple so that changes to the list of the caller do not affect us
+                # (because we are in a frozen dataclass we need this workaround to set attributes)
+                object.__setattr__(self, attr, tuple(val))
             # handle normal case
             else:
-                expected_type = config_types[attr]
                 if not isinstance(val, expected_type):
                     raise TypeError(f'Parameter "{attr}" is not of type {expected_type}. Type: {type_}')
 
@@ -93,6 +96,8 @@ class Config:
     def get_default(field:str):
         """
         Gets the default value of given field of the dataclass.
+        See also the read-only mapping `Config.DEFAULTS` for getting
+        all default values at once.
 
         Examples
         --------
@@ -100,9 +105,20 @@ class Config:
         'python'
         """
         try:
-            default = Config.__dataclass_fields__[field].default
-            if default is MISSING:  # pragma: no cover
-                raise ValueError(f'Field "{field}" has no default value')
-            return default
+            return Config.DEFAULTS[field]
         except KeyError as e:
+            if field in Config.__dataclass_fields__:  # pragma: no cover
+                raise ValueError(f'Field "{field}" has no default value') from e
             raise AttributeError(f'Config has no attribute "{field}"') from e
+
+
+# read-only mapping {field: default value} for the fields of Config that have a default value
+# (fields using a default factory such as "members" are not included)
+Config.DEFAULTS = MappingProxyType({name:field.default for name, field in Config.__dataclass_fields__.items()
+                                    if field.default is not MISSING})
+
+
+# tuple of (field name, type) of the Config class. Retrieving the type hints is
+# rather slow so we only do it once instead of every time a Config is instanciated
+config_type_hints = get_type_hints(Config)
+config_field_types = tuple((field.name, config_type_hints[field.name]) for field in dataclass_fields(Config))
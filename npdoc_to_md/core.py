@@ -3,18 +3,20 @@
 Contains all objects that will be directly exposed to the users of the library
 e.g. `render_obj_docstring`
 """
-from functools import wraps
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, wraps
+from itertools import repeat
 import logging
+import os
 import re
 import sys
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields as dataclass_fields
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Iterable, Iterator, List, Optional, Union
 
 # local imports
-from npdoc_to_md.helpers import FileOperations, Patterns
+from npdoc_to_md.helpers import FileOperations, Patterns, dataclass_slots, locate
 from npdoc_to_md.logger import log
-from npdoc_to_md.parsers import parse_and_render
 from npdoc_to_md.placeholder import Config, Placeholder
 
 
@@ -22,7 +24,9 @@ from npdoc_to_md.placeholder import Config, Placeholder
 # # Local helpers
 
 # +
-@dataclass(frozen=True)
+
+
+@dataclass(frozen=True, **dataclass_slots)
 class RenderedFile:
     """
     Represents a template file that has been converted by the npdoc_to_md library.
@@ -41,21 +45,26 @@ class RenderedFile:
         Filepath to the rendered template or None if the user did
         not wish to save the result to a file
     original_text
-        Text of the template file
+        Text of the template file or None if the texts were not
+        kept in memory (see parameter `return_text` of `render_file`)
     rendered_text
         Text obtained after rendering the template file (after a function
-        from npdoc_to_md was used)
+        from npdoc_to_md was used) or None (same logic as for `original_text`)
     """
     source:str
     destination:Union[str, None]
-    original_text:str
-    rendered_text:str
+    original_text:Union[str, None]
+    rendered_text:Union[str, None]
 
     def __getattr__(self, attr:str):
         """
         We overwrite __getattr__ to allow aliases such as "original-text" for the CLI.
+        Note that this is only called when the normal attribute lookup fails.
         """
-        return self.__getattribute__(attr.replace('-', '_'))
+        name = _rendered_file_aliases.get(attr)
+        if name is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attr}'")
+        return object.__getattribute__(self, name)
 
     def __repr__(self):
         return (f'source: {self.source}\n'
@@ -64,6 +73,10 @@ class RenderedFile:
                 f'rendered_text:\n{self.rendered_text}')
 
 
+# {alias: attribute} e.g. {"original-text": "original_text"}
+_rendered_file_aliases = {f.name.replace('_', '-'):f.name for f in dataclass_fields(RenderedFile)}
+
+
 @dataclass(frozen=True)
 class RenderedFileCLI(RenderedFile):
     """
@@ -79,7 +92,9 @@ class RenderedFileCLI(RenderedFile):
     @classmethod
     def _from_rendered_file(cls, obj:RenderedFile):
         assert isinstance(obj, RenderedFile)
-        return cls(**asdict(obj))
+        # don't use `dataclasses.asdict` which would needlessly deep copy the texts
+        return cls(source=obj.source, destination=obj.destination,
+                   original_text=obj.original_text, rendered_text=obj.rendered_text)
 
 
 class RenderedFilesCLI(list):
@@ -120,6 +135,35 @@ class RenderedFilesCLI(list):
 
 # # Render using Python objects
 
+@lru_cache(maxsize=1024)
+def _render_obj_docstring_cached(obj:str, config:Config) -> str:
+    """
+    Cached version of `parse_and_render` so that objects referenced multiple times
+    (e.g. in different placeholders or files) are only rendered once.
+    See `render_obj_docstring.cache_clear` for resetting the cache.
+
+    The disk cache (see module `npdoc_to_md._cache`) is handled by `parse_and_render`
+    for the object and each of its members.
+    """
+    # the parsers import numpydoc which is slow, we only need them when we actually
+    # have to render something (e.g. not for texts without placeholders or cache hits)
+    from npdoc_to_md.parsers import parse_and_render
+
+    return parse_and_render(obj_namespace=obj, config=config)
+
+
+def _render_obj_docstring_from_config(obj:str, config:Config) -> str:
+    """
+    Does the actual work of `render_obj_docstring` using an existing
+    Config instance (e.g. the one of a placeholder) so that we do not
+    have to create and validate a new one.
+    """
+    if not isinstance(obj, str):
+        raise TypeError('Expected parameter `obj` to be a string of an importable python object '
+                        f'e.g. "pandas.DataFrame", "datetime.datetime", ... . Got type {type(obj)} instead')
+    return _render_obj_docstring_cached(obj=obj, config=config)
+
+
 # IMPORTANT! further down the line (in other modules) `obj` will be referred to as `obj_namespace`
 # and `obj` will be the actual Python object at given importable path
 def render_obj_docstring(obj:str,
@@ -138,6 +182,21 @@ def render_obj_docstring(obj:str,
     in the wiki of the library.
     See wiki folder at the root of the repo or https://github.com/ThibTrip/npdoc_to_md/wiki
 
+    Results are cached for each combination of object and parameters. If the
+    docstrings change while your Python process is running (e.g. after reloading
+    a module) you can reset the cache with `render_obj_docstring.cache_clear()`
+    (this also resets the caches of the objects, sections and signatures looked up
+    for the renderings).
+
+    Renderings can also be cached on disk across Python processes by setting
+    the environment variable "NPDOC_TO_MD_CACHE" to "1" (cache in the folder
+    ".npdoc_to_md_cache") or "NPDOC_TO_MD_CACHE_DIR" to the path of a folder.
+    The object and each of its members are cached separately and the key of a cached
+    rendering includes the docstring of the object and the modification time of its
+    source file so it is invalidated when they change.
+    The renderings saved on disk can be deleted with `npdoc-to-md clear-cache`
+    (only the subfolder "npdoc_to_md" created by the library in the cache folder is deleted).
+
     CLI Examples
     ------------
     Note that "-" and "_" are interchangeable
@@ -161,10 +220,6 @@ def render_obj_docstring(obj:str,
     ...                           remove_doctest_blanklines=True,
     ...                           md_section_level=3)
     """
-    if not isinstance(obj, str):
-        raise TypeError('Expected parameter `obj` to be a string of an importable python object '
-                        f'e.g. "pandas.DataFrame", "datetime.datetime", ... . Got type {type(obj)} instead')
-
     config = Config(alias=alias,
                     examples_md_lang=examples_md_lang,
                     remove_doctest_blanklines=remove_doctest_blanklines,
@@ -172,7 +227,27 @@ def render_obj_docstring(obj:str,
                     md_section_level=md_section_level,
                     ignore_custom_section_warning=ignore_custom_section_warning,
                     members=[] if members is None else members)
-    return parse_and_render(obj_namespace=obj, config=config)
+    return _render_obj_docstring_from_config(obj=obj, config=config)
+
+
+def _clear_caches() -> None:
+    """
+    Clears all the in-memory caches used for rendering docstrings (renderings,
+    located objects, sections and signatures) so that objects are looked up
+    again e.g. after reloading a module (see `render_obj_docstring.cache_clear`)
+    """
+    _render_obj_docstring_cached.cache_clear()
+    locate.cache_clear()
+    # the modules below may not be imported yet (see `_render_obj_docstring_cached`)
+    sections = sys.modules.get('npdoc_to_md.sections')
+    if sections is not None:
+        sections._cached_sections_finder.cache_clear()
+    parsers = sys.modules.get('npdoc_to_md.parsers')
+    if parsers is not None:
+        parsers._get_clean_signature_cached.cache_clear()
+
+
+render_obj_docstring.cache_clear = _clear_caches
 
 
 # # Render using text 
@@ -192,16 +267,8 @@ def _render_placeholder(placeholder:Placeholder) -> str:
     >>> p = Placeholder('{{"obj":"npdoc_to_md.testing.now_utc", "alias":"now_utc", "examples_md_lang":"raw"}}')
     >>> md = _render_placeholder(placeholder=p)
     """
-    config:Config = placeholder.config
-    rendered = render_obj_docstring(obj=placeholder.obj_namespace,
-                                    alias=config.alias,
-                                    examples_md_lang=config.examples_md_lang,
-                                    remove_doctest_blanklines=config.remove_doctest_blanklines,
-                                    remove_doctest_skip=config.remove_doctest_skip,
-                                    md_section_level=config.md_section_level,
-                                    ignore_custom_section_warning=config.ignore_custom_section_warning,
-                                    members=config.members)
-    return rendered
+    # the config of the placeholder has already been validated
+    return _render_obj_docstring_from_config(obj=placeholder.obj_namespace, config=placeholder.config)
 
 
 def _render_placeholder_no_err(placeholder:Placeholder) -> str:
@@ -232,6 +299,52 @@ def _render_placeholder_no_err(placeholder:Placeholder) -> str:
 
 # -
 
+# ## Helper to render lines
+
+def _render_lines(lines:Iterable[str], ignore_errors:bool=False) -> Iterator[str]:
+    """
+    Yields given lines (each line may end with a line break e.g. when using
+    `str.splitlines(keepends=True)`) where placeholders have been replaced with
+    the corresponding docstrings rendered in Markdown. Line breaks are preserved.
+
+    See function `render_string` for the parameter `ignore_errors`.
+
+    Examples
+    --------
+    >>> list(_render_lines(['# Title\r\n', 'Some text\n', 'The end']))
+    ['# Title\r\n', 'Some text\n', 'The end']
+    """
+    if ignore_errors:
+        render_placeholder_method = _render_placeholder_no_err
+        search_placeholder_method = Placeholder.search_no_err
+    else:
+        render_placeholder_method = _render_placeholder
+        search_placeholder_method = Placeholder.search
+
+    for line in lines:
+        # placeholders always contain "{{" so we can skip any line without it.
+        # a substring search is much cheaper than parsing each line
+        if '{{' not in line:
+            yield line
+            continue
+        placeholder:Union[Placeholder, None] = search_placeholder_method(line)
+        if placeholder is None:
+            yield line
+            continue
+        # keep the line break of the line (if any)
+        line_break = line[len(line.splitlines()[0]):]
+        yield render_placeholder_method(placeholder=placeholder) + line_break
+
+
+def _render_line(line:str, ignore_errors:bool=False) -> str:
+    """
+    Renders a single line without line break that may be a placeholder
+    (see `_render_lines`). Defined at module level so that it can be used
+    in a pool of processes.
+    """
+    return next(_render_lines(lines=[line], ignore_errors=ignore_errors))
+
+
 # ## Function to render from text
 
 def render_string(string:str, ignore_errors:bool=False) -> str:
@@ -246,7 +359,8 @@ def render_string(string:str, ignore_errors:bool=False) -> str:
     ----------
     string
         String with markdown syntax (we will split it in lines)
-        containing (or not) placeholders defined in this library
+        containing (or not) placeholders defined in this library.
+        Line breaks of the string are preserved (e.g. "\r\n" stays "\r\n").
     ignore_errors
         If True only logs errors relative to converting placeholders
         in the string otherwise raises such errors.
@@ -307,28 +421,52 @@ def render_string(string:str, ignore_errors:bool=False) -> str:
     >>> # demonstrating "ignore_errors": this raises no error even though we are referring to a non existent object
     >>> md = render_string(string='{{"obj":"some_object_that_does_not_exist"}}', ignore_errors=True)
     '''
-    if ignore_errors:
-        render_placeholder_method = _render_placeholder_no_err
-        search_placeholder_method = Placeholder.search_no_err
-    else:
-        render_placeholder_method = _render_placeholder
-        search_placeholder_method = Placeholder.search
+    # shortcut for texts without any placeholder (see `_render_lines`)
+    if '{{' not in string:
+        return string
 
-    new_lines:List[str] = []
-    for line in string.splitlines():
-        placeholder:Union[Placeholder, None] = search_placeholder_method(line)
-        if placeholder is not None:
-            rendered = render_placeholder_method(placeholder=placeholder)
-            new_lines.append(rendered)
-        else:
-            new_lines.append(line)
-    return '\n'.join(new_lines)
+    # locate the lines that look like placeholders with a single regex scan of the
+    # whole text and only render these, the rest of the text is kept as is
+    # (including the line breaks that are not part of the matches)
+    return Patterns.placeholder_lines.sub(lambda m: _render_line(line=m.group(), ignore_errors=ignore_errors),
+                                          string)
 
 
 # # Render using file
 
+# ## Helpers for file operations
+
+# +
+# buffer size for reading and writing files line by line (see `render_file`)
+_stream_buffer_size = 1 << 16
+
+
+def _read_text(filepath:str) -> str:
+    """
+    Reads the text of a template file
+    """
+    # reading bytes and decoding them in one go is faster than a text stream
+    # (which decodes chunk by chunk) and gives the same result as line breaks
+    # are not translated (same as `newline='\n'`)
+    with open(filepath, mode='rb') as fh:
+        return fh.read().decode('utf-8')
+
+
+def _write_text(filepath:str, text:str) -> None:
+    """
+    Writes the text of a rendered template file
+    """
+    # same logic as in `_read_text`
+    with open(filepath, mode='wb') as fh:
+        fh.write(text.encode('utf-8'))
+
+
+# -
+
+# ## Function to render from file
+
 def render_file(source:str, destination:Optional[str]=None,
-                ignore_errors:bool=False) -> Union[RenderedFile, RenderedFileCLI]:
+                ignore_errors:bool=False, return_text:bool=True) -> Union[RenderedFile, RenderedFileCLI]:
     """
     Reads markdown file at path `source` and replaces placeholders defined in this library
     with the corresponding docstrings. It then returns the "converted" text.
@@ -348,6 +486,12 @@ def render_file(source:str, destination:Optional[str]=None,
         at this path with the converted markdown string.
     ignore_errors
         Same logic as in function `render_string` (see its docstring)
+    return_text
+        If False and a `destination` is given, the file is rendered line by line
+        and written directly to `destination` so that the texts never have to be
+        fully loaded in memory (useful for large files). The attributes
+        `original_text` and `rendered_text` of the returned object are then None.
+        Ignored when `destination` is None.
 
     CLI Examples
     ------------
@@ -382,10 +526,31 @@ def render_file(source:str, destination:Optional[str]=None,
     >>> destination = "./README_converted.md"
     >>> rendered_file = render_file(source=source, destination=destination) # doctest: +SKIP
     """
+    # case where we stream the lines from the source to the destination
+    if destination is not None and not return_text:
+        log(f'Rendering file contents at path {source} line by line to path {destination}')
+        # write to a temporary file that we then move to `destination` so that `destination`
+        # is never partially written (this also allows `destination` to be the same as `source`)
+        tmp_destination = f'{destination}.{os.getpid()}.tmp'
+        try:
+            with open(source, mode='r', encoding='utf-8', newline='\n', buffering=_stream_buffer_size) as fh_src, \
+                 open(tmp_destination, mode='w', encoding='utf-8', newline='\n',
+                      buffering=_stream_buffer_size) as fh_dest:
+                # the file is read line by line on "\n" only (see `newline`) so we split each of these lines
+                # with `splitlines` to get the same lines as `render_string` (see `Patterns.placeholder_lines`
+                # which delimits lines like `str.splitlines` e.g. also on "\r" or "\x0c")
+                lines = (line for file_line in fh_src for line in file_line.splitlines(keepends=True))
+                for rendered in _render_lines(lines=lines, ignore_errors=ignore_errors):
+                    fh_dest.write(rendered)
+            os.replace(tmp_destination, destination)
+        finally:
+            if os.path.exists(tmp_destination):
+                os.remove(tmp_destination)
+        return RenderedFile(source=source, destination=destination, original_text=None, rendered_text=None)
+
     # read contents
     log(f'Reading file contents at path {source}')
-    with open(source, mode='r', encoding='utf-8', newline='\n') as fh:
-        original_text = fh.read()
+    original_text = _read_text(filepath=source)
     # render
     log('Rendering file contents')
     rendered_text = render_string(string=original_text, ignore_errors=ignore_errors)
@@ -393,20 +558,44 @@ def render_file(source:str, destination:Optional[str]=None,
     # save
     if destination is not None:
         log(f'Saving rendered contents to path {destination}')
-        with open(destination, mode='w', encoding='utf-8', newline='\n') as fh:
-            fh.write(rendered_text)
+        _write_text(filepath=destination, text=rendered_text)
     return RenderedFile(source=source, destination=destination,
                         original_text=original_text, rendered_text=rendered_text)
 
 
 # # Render using folder
 
+# ## Helpers
+
+def _compute_destination(source:str, destination:Optional[str], filepath:str) -> Union[str, None]:
+    """
+    Gets the path where the rendered version of the template at `filepath`
+    (located in the folder `source`) should be saved in the folder `destination`
+    (see function `render_folder`).
+
+    Returns None if `destination` is None.
+    """
+    if destination is None:
+        return None
+    destination_path = FileOperations.switch_folder(source_folder=source,
+                                                    destination_folder=destination,
+                                                    filepath=filepath)
+    # replace extension to Markdown (case of template or otherwise)
+    not_md = not destination_path.lower().strip().endswith('.md')
+    if not_md:
+        destination_path = str(Path(destination_path).with_suffix('.md'))
+    return destination_path
+
+
+# ## Function to render from folder
+
 def render_folder(source:str,
                   destination:Optional[str]=None,
                   recursive:bool=False,
                   ignore_errors:bool=False,
                   pattern:Optional[str]=None,
-                  case_sensitive:bool=False) -> Union[List[RenderedFile], RenderedFilesCLI]:
+                  case_sensitive:bool=False,
+                  max_workers:Optional[int]=1) -> Union[List[RenderedFile], RenderedFilesCLI]:
     r"""
     Reads all markdown files in the folder at path `source`
     and for each markdown file, replaces placeholders defined in this library
@@ -446,6 +635,11 @@ def render_folder(source:str,
     case_sensitive
         Whether the `pattern` is case sensitive. By default this is False (`pattern` is
         case insensitive)
+    max_workers
+        Number of processes to use for rendering the placeholders (each distinct
+        placeholder of the folder is only rendered once). If 1 (default) the
+        placeholders are rendered one after the other in the current process.
+        If None, uses as many processes as there are CPUs on the machine.
 
     CLI Examples
     ------------
@@ -490,26 +684,54 @@ def render_folder(source:str,
 
     # get markdown files in folder
     filepaths = FileOperations.list_files(folder=source, pattern=pattern, recursive=recursive)
+    destination_paths = [_compute_destination(source=source, destination=destination, filepath=filepath)
+                         for filepath in filepaths]
     nb_files = len(filepaths)
 
-    # render markdown files
-    rendered_files = []
+    # read all files beforehand using threads so that the disk reads overlap
+    # (this is much faster than reading them one by one for many small files)
     log(f'{"#"*10} Processing folder "{source}" {"#"*10}')
-    for ix, filepath in enumerate(filepaths):
-        log(f'{"-"*10} Processing path {ix+1}/{nb_files} {"-"*10}')
-        if destination is not None:
-            destination_path = FileOperations.switch_folder(source_folder=source,
-                                                            destination_folder=destination,
-                                                            filepath=filepath)
-            # replace extension to Markdown (case of template or otherwise)
-            not_md = not destination_path.lower().strip().endswith('.md')
-            if not_md:
-                destination_path = str(Path(destination_path).with_suffix('.md'))
-        else:
-            destination_path = None
-        rendered_file = render_file(source=filepath, destination=destination_path, ignore_errors=ignore_errors)
-        rendered_files.append(rendered_file)
-    return rendered_files
+    log(f'Reading contents of {nb_files} files')
+    with ThreadPoolExecutor() as executor:
+        original_texts = list(executor.map(_read_text, filepaths))
+
+    # locate the lines that look like placeholders in all files (see `render_string`).
+    # The same placeholder is often used in multiple files so we only render each distinct line once
+    unique_lines = {}  # dict rather than set to keep the order of appearance
+    for text in original_texts:
+        if '{{' in text:
+            unique_lines.update(dict.fromkeys(m.group() for m in Patterns.placeholder_lines.finditer(text)))
+    unique_lines = list(unique_lines)
+    nb_lines = len(unique_lines)
+
+    # render distinct lines
+    log(f'Rendering {nb_lines} distinct placeholders found in {nb_files} files')
+    if max_workers == 1 or nb_lines < 2:
+        rendered_lines = [_render_line(line=line, ignore_errors=ignore_errors) for line in unique_lines]
+    else:
+        # the lines are independent so we can render them in parallel
+        # (`map` preserves the order of the lines)
+        log(f'Using a pool of processes (max_workers={max_workers})')
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            rendered_lines = list(executor.map(_render_line, unique_lines, repeat(ignore_errors, nb_lines)))
+    rendered_mapping = dict(zip(unique_lines, rendered_lines))
+
+    # put the rendered lines back in the files
+    rendered_texts = [Patterns.placeholder_lines.sub(lambda m: rendered_mapping[m.group()], text)
+                      if '{{' in text else text for text in original_texts]
+
+    # save rendered files (same logic as for reading)
+    to_save = [(d, t) for d, t in zip(destination_paths, rendered_texts) if d is not None]
+    if to_save:
+        log(f'Saving rendered contents of {len(to_save)} files to folder {destination}')
+        with ThreadPoolExecutor() as executor:
+            # consume the iterator so exceptions are raised
+            list(executor.map(lambda args: _write_text(*args), to_save))
+
+    return [RenderedFile(source=filepath, destination=destination_path,
+                         original_text=original_text, rendered_text=rendered_text)
+            for filepath, destination_path, original_text, rendered_text
+            in zip(filepaths, destination_paths, original_texts, rendered_texts)]
 
 
 # # Start CLI
@@ -539,8 +761,13 @@ def start_cli() -> None:
                 raise TypeError(f'Unexpected return type from function {func.__name__}: {type(result)}')
         return wrapper
 
+    # the disk cache is only needed for the subcommand "clear-cache" (see `_render_engine`
+    # in module `npdoc_to_md.parsers` for the renderings)
+    from npdoc_to_md import _cache
+
     # cli mapping (which subcommand executes which function)
-    cli_mapping = {'render-obj-docstring':render_obj_docstring,
+    cli_mapping = {'clear-cache':_cache.clear,
+                   'render-obj-docstring':render_obj_docstring,
                    'render-string':render_string,
                    'render-file':rendered_files_to_rendered_files_cli(render_file),
                    'render-folder':rendered_files_to_rendered_files_cli(render_folder)}
@@ -6,10 +6,14 @@ lines outside of examples)
 """
 from dataclasses import dataclass
 from enum import IntEnum, auto as enumauto
-from typing import List, Union
+from typing import Dict, List, Tuple, Union
 
 # local imports
-from npdoc_to_md.helpers import Patterns, previous_current_next
+from npdoc_to_md.helpers import cached_property, dataclass_slots
+
+
+# prompts of inputs in docstring examples (see `npdoc_to_md.helpers.Patterns.console_py`)
+console_prompts = ('>>>', '...')
 
 
 # -
@@ -38,10 +42,23 @@ class ExampleLineType(IntEnum):
     OUTPUT_LANG = enumauto()
 
 
+# transitions (label of previous line, label of current line, current line is empty)
+# that start a new example block (see `ExamplesLabeller._labels_and_blocks_start`):
+# * examples separated by a line break
+# * for the other examples wait for an output line (could also be an empty
+#   line separating the examples, I have not made a distinction for that)
+#   before declaring a new block
+block_start_transitions = frozenset([(ExampleLineType.INPUT, label, True) for label in ExampleLineType] +
+                                    [(ExampleLineType.OUTPUT, label, is_empty)
+                                     for label in (ExampleLineType.INPUT, ExampleLineType.TEXT)
+                                     for is_empty in (True, False)])
+
+
 # # Helper dataclasses
 
 # +
-@dataclass(frozen=True)
+# one instance per line of the examples so we use slots (when available)
+@dataclass(frozen=True, **dataclass_slots)
 class ExampleLine:
     global_index:int
     line:str
@@ -68,36 +85,54 @@ class ExampleBlock:
 
     example_lines:List[ExampleLine]
 
-    @property
-    def output_lang(self) -> str:
-        # locate the first line indicating the language for the example output e.g. {{html}}
-        iterator = (exl.line for exl in self.example_lines if exl.line_type is ExampleLineType.OUTPUT_LANG)
-        flav = next(iterator, None)
-        return flav.lstrip('{').rstrip('}').strip() if flav is not None else None
+    @cached_property
+    def _first_and_last_lines(self) -> Dict[ExampleLineType, Tuple[ExampleLine, ExampleLine]]:
+        """
+        Returns the first and last line of each line type in the example block
+        (the lines of a block are in the order of the docstring) so that we can
+        get all notable lines with a single pass
+        """
+        first_and_last = {}
+        for exl in self.example_lines:
+            previous = first_and_last.get(exl.line_type)
+            first_and_last[exl.line_type] = (exl, exl) if previous is None else (previous[0], exl)
+        return first_and_last
 
-    def _get_ix(self, operator:Union[min, max], line_type:ExampleLineType):
+    def _get_ix(self, first:bool, line_type:ExampleLineType) -> Union[int, None]:
         """
         Helper to make properties for notable line indices in the example block
         e.g. property `ix_first_input`.
         """
-        iterator = (exl.global_index for exl in self.example_lines if exl.line_type is line_type)
-        return operator(iterator, default=None)
+        first_and_last = self._first_and_last_lines.get(line_type)
+        if first_and_last is None:
+            return None
+        return first_and_last[0 if first else 1].global_index
 
-    @property
+    @cached_property
+    def output_lang(self) -> str:
+        # locate the first line indicating the language for the example output e.g. {{html}}
+        first_and_last = self._first_and_last_lines.get(ExampleLineType.OUTPUT_LANG)
+        if first_and_last is None:
+            return None
+        # such lines begin with "{{" and end with "}}" ignoring surrounding whitespace
+        # (see `ExamplesLabeller`) so we can slice the braces away
+        return first_and_last[0].line.strip()[2:-2].strip()
+
+    @cached_property
     def ix_first_input(self) -> int:
-        return self._get_ix(operator=min, line_type=ExampleLineType.INPUT)
+        return self._get_ix(first=True, line_type=ExampleLineType.INPUT)
 
-    @property
+    @cached_property
     def ix_last_input(self) -> int:
-        return self._get_ix(operator=max, line_type=ExampleLineType.INPUT)
+        return self._get_ix(first=False, line_type=ExampleLineType.INPUT)
 
-    @property
+    @cached_property
     def ix_first_output(self) -> int:
-        return self._get_ix(operator=min, line_type=ExampleLineType.OUTPUT)
+        return self._get_ix(first=True, line_type=ExampleLineType.OUTPUT)
 
-    @property
+    @cached_property
     def ix_last_output(self) -> int:
-        return self._get_ix(operator=max, line_type=ExampleLineType.OUTPUT)
+        return self._get_ix(first=False, line_type=ExampleLineType.OUTPUT)
 
     def __repr__(self):
         # for once we should overwrite the dataclass repr
@@ -148,76 +183,66 @@ class ExamplesLabeller:
 
     >>> print(el.example_blocks[1].output_lang)
     None
+
+    >>> # whitespace around the language placeholder is ignored
+    >>> ExamplesLabeller(lines=['  {{ html }}', '>>> 1', '1']).example_blocks[0].output_lang
+    'html'
     """
     lines:List[str]
 
-    @property
-    def labels(self):
-        lines = self.lines
-        if len(lines) == 0:  # pragma: no cover
-            return []
+    @cached_property
+    def _labels_and_blocks_start(self) -> Tuple[List[ExampleLine], List[int]]:
+        """
+        Labels each line and finds the start of each example block
+        in a single pass over the lines (see properties `labels` and `example_blocks`)
+        """
         labelled_lines = []
-        for ix, (previous_line, line, current_line) in enumerate(previous_current_next(lines)):
-            # easy case where we know it's an input
-            is_input = Patterns.console_py.search(line)
-            if is_input:
-                labelled_lines.append(ExampleLine(global_index=ix, line=line, line_type=ExampleLineType.INPUT))
-                continue
-
-            # distinguish outputs and comments before tests
-            previous_label = labelled_lines[ix - 1].line_type if ix > 0 else None
-            # note that an empty line ends an example
-            # indeed, in pytest you even have to use <BLANKLINE> to indicate an empty line as part of an output
-            follows_input = previous_line is not None and previous_label is ExampleLineType.INPUT
-            follows_output = previous_label is ExampleLineType.OUTPUT
-            is_empty_line = line.strip() == ''
-            previous_line_empty = previous_line is not None and previous_line.strip() == ''
-            is_example_output = ((follows_input and not is_input and not is_empty_line) or
-                                 (follows_output and not is_empty_line and not previous_line_empty))
-            if is_example_output:
-                labelled_lines.append(ExampleLine(global_index=ix, line=line, line_type=ExampleLineType.OUTPUT))
-            else:
-                # if not an example output we have to assume by elimination that it is some information (text)
-                # before the example e.g. "* first example"
-                stripped = line.strip()
-                is_lang = stripped.startswith('{{') and stripped.endswith('}}')
-                line_type = ExampleLineType.OUTPUT_LANG if is_lang else ExampleLineType.TEXT
-                labelled_lines.append(ExampleLine(global_index=ix, line=line, line_type=line_type))
-        assert len(labelled_lines) == len(self.lines)
-        return labelled_lines
-
-    @property
-    def example_blocks(self):
-        # find the start of each example block using the labels
         blocks_start = []
-        labels = self.labels
-        for ix, example_line in enumerate(labels):
-            # easy case of the first example
-            if ix == 0:
+        previous_line_empty = False
+        previous_label = None
+        for ix, line in enumerate(self.lines):
+            # strip each line only once (the result is used for several checks)
+            stripped = line.strip()
+            is_empty_line = not stripped
+
+            # label the line
+            # easy case where we know it's an input (same as `Patterns.console_py.search(line)`
+            # but `str.startswith` is cheaper than a regex for such a simple check)
+            if line.startswith(console_prompts):
+                label = ExampleLineType.INPUT
+            else:
+                # distinguish outputs and comments before tests
+                # note that an empty line ends an example
+                # indeed, in pytest you even have to use <BLANKLINE> to indicate an empty line as part of an output
+                follows_input = previous_label is ExampleLineType.INPUT
+                follows_output = previous_label is ExampleLineType.OUTPUT
+                is_example_output = ((follows_input and not is_empty_line) or
+                                     (follows_output and not is_empty_line and not previous_line_empty))
+                if is_example_output:
+                    label = ExampleLineType.OUTPUT
+                else:
+                    # if not an example output we have to assume by elimination that it is some information (text)
+                    # before the example e.g. "* first example"
+                    is_lang = stripped.startswith('{{') and stripped.endswith('}}')
+                    label = ExampleLineType.OUTPUT_LANG if is_lang else ExampleLineType.TEXT
+            labelled_lines.append(ExampleLine(global_index=ix, line=line, line_type=label))
+
+            # check if the line starts a new example block (first example
+            # or see `block_start_transitions` for the other examples)
+            if ix == 0 or (previous_label, label, is_empty_line) in block_start_transitions:
                 blocks_start.append(ix)
-                continue
 
-            # easy case of examples separated by a line break
-            previous = labels[ix - 1]
-            if previous.line_type is ExampleLineType.INPUT and example_line.line.strip() == '':
-                blocks_start.append(ix)
-                continue
-
-            # for the other examples wait for an output line (could also be an empty
-            # line separating the examples, I have not made a distinction for that)
-            # before
-            # declaring a new block
-            if previous.line_type is not ExampleLineType.OUTPUT:
-                continue
-            if example_line.line_type in (ExampleLineType.INPUT, ExampleLineType.TEXT):
-                blocks_start.append(ix)
+            previous_line_empty, previous_label = is_empty_line, label
+        return labelled_lines, blocks_start
 
+    @cached_property
+    def labels(self) -> List[ExampleLine]:
+        return self._labels_and_blocks_start[0]
+
+    @cached_property
+    def example_blocks(self) -> List[ExampleBlock]:
+        labels, blocks_start = self._labels_and_blocks_start
         # get the corresponding line objects
-        blocks = []
-        for _, start_ix, next_ix in previous_current_next(blocks_start):
-            if next_ix is not None:
-                blocks.append(ExampleBlock(labels[start_ix:next_ix]))
-            # case of last item
-            else:
-                blocks.append(ExampleBlock(labels[start_ix:]))
-        return blocks
+        # (the last block goes until the end, slicing with None does that)
+        blocks_end = blocks_start[1:] + [None]
+        return [ExampleBlock(labels[start_ix:end_ix]) for start_ix, end_ix in zip(blocks_start, blocks_end)]
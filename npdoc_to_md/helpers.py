@@ -2,9 +2,13 @@
 Helpers for the various modules of the library
 """
 import os
+import pydoc
 import re
+import sys
+from functools import lru_cache
+from itertools import chain, islice, tee
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Callable, Iterable, Iterator, List, Tuple, Union
 
 
 # # Regex patterns
@@ -24,23 +28,77 @@ class Patterns:
     self_or_cls
         Matches special arguments "self" or "cls" that we remove from signatures.
         Also matches any subsequent character we'll have to remove (following space(s)
-        and comma(s))
+        and comma(s)).
+        Deprecated: no longer used by the library (the first parameter of signatures
+        is now removed using `inspect.Signature`, see `npdoc_to_md.parsers.SignatureParser`)
     template_files
         Matches file extensions ".np" and ".md" case sensitive
     template_files_insensitive
         Same as attribute `template_files` but case insensitive
+    template_files_suffixes
+        Not a regex pattern: file extensions matched by attribute `template_files`
+        (for `str.endswith` which is much cheaper than a regex search)
+    section_underline
+        Matches lines that can be underlining a section header in a docstring
+        e.g. "----------" (see `npdoc_to_md.sections.SectionsFinder`)
+    placeholder
+        Matches lines that look like a placeholder of the library
+        (begins with "{{" and ends with "}}" ignoring surrounding whitespace)
+    placeholder_lines
+        Finds all lines that look like a placeholder of the library in a whole text
+        (same logic as attribute `placeholder`). Lines are delimited like with
+        `str.splitlines` (e.g. "\\n", "\\r\\n", "\\r" but also "\\x0c", "\\u2028", ...)
+        and the line breaks are not part of the matches
     """
-    console_py = re.compile(r'^(\>\>\> ?|\.\.\. ?)')
-    doctest_skip = re.compile(r' *\# *doctest: *\+SKIP *$')
-    blankline = re.compile(r'^ *\<BLANKLINE\> *$')
-    self_or_cls = re.compile(r'(?<=\()(self|cls) *\,* *')  # positive lookbehind of "(" before self|cls
-    template_files = re.compile(r'\.(np)?md$')
-    template_files_insensitive = re.compile(template_files.pattern, flags=re.IGNORECASE)
+    # patterns that only deal with ASCII characters use the flag `re.ASCII`
+    # (no Unicode handling needed e.g. for case insensitive matching)
+    console_py = re.compile(r'^(?:>>> ?|\.\.\. ?)', flags=re.ASCII)
+    doctest_skip = re.compile(r' *\# *doctest: *\+SKIP *$', flags=re.ASCII)
+    blankline = re.compile(r'^ *\<BLANKLINE\> *$', flags=re.ASCII)
+    self_or_cls = re.compile(r'(?<=\()(?:self|cls) *,* *', flags=re.ASCII)  # positive lookbehind of "(" before self|cls
+    template_files = re.compile(r'\.(?:np)?md$', flags=re.ASCII)
+    template_files_insensitive = re.compile(template_files.pattern, flags=re.ASCII | re.IGNORECASE)
+    template_files_suffixes = ('.md', '.npmd')
+    section_underline = re.compile(r'^ *[-=]+\s*$')
+    placeholder = re.compile(r'^\s*\{\{.*\}\}\s*$', flags=re.DOTALL)
+    # characters that delimit lines for `str.splitlines` ("[^\S{line_breaks}]" = whitespace other than line breaks)
+    _line_breaks = r'\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+    placeholder_lines = re.compile(rf'(?:^|(?<=[{_line_breaks}]))[^\S{_line_breaks}]*\{{\{{[^{_line_breaks}]*\}}\}}'
+                                   rf'[^\S{_line_breaks}]*(?=[{_line_breaks}]|$)')
 
 
 # # Generic helpers
 
 # +
+# slots make instances lighter and the access to their attributes faster
+# (the parameter `slots` of dataclasses is only available from Python 3.10)
+# usage: `@dataclass(frozen=True, **dataclass_slots)`
+dataclass_slots = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+try:
+    from functools import cached_property
+except ImportError:  # pragma: no cover
+    # backport for Python < 3.8 (without the lock of the Python 3.8 version
+    # which we do not need)
+    class cached_property:
+        """
+        Decorator that converts a method into a property whose value is computed
+        once and then stored in the `__dict__` of the instance (this also works
+        with frozen dataclasses as long as they do not use slots)
+        """
+
+        def __init__(self, func):
+            self.func = func
+            self.attrname = func.__name__
+            self.__doc__ = func.__doc__
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = instance.__dict__[self.attrname] = self.func(instance)
+            return value
+
+
 def previous_current_next(iterable:Iterable) -> Iterable[tuple]:
     """
     Iterator that yields (previous, current, next) tuple per element.
@@ -57,18 +115,29 @@ def previous_current_next(iterable:Iterable) -> Iterable[tuple]:
     (None, 1, 2)
     (1, 2, 3)
     (2, 3, None)
+
+    >>> list(previous_current_next([]))
+    []
     """
-    iterable = iter(iterable)
-    prv = None
-    cur = iterable.__next__()
-    try:
-        while True:
-            nxt = iterable.__next__()
-            yield (prv, cur, nxt)
-            prv = cur
-            cur = nxt
-    except StopIteration:
-        yield (prv, cur, None)
+    # the iteration is done by itertools and zip (implemented in C)
+    previous_it, current_it, next_it = tee(iterable, 3)
+    return zip(chain([None], previous_it), current_it, chain(islice(next_it, 1, None), [None]))
+
+
+@lru_cache(maxsize=1024)
+def locate(obj_namespace:str) -> Any:
+    """
+    Cached version of `pydoc.locate` (imports and returns the object at given
+    namespace e.g. "datetime.datetime" or None if it does not exist).
+    The same namespace is often located multiple times (by different parsers,
+    in different placeholders, ...) and each lookup walks the import chain.
+
+    Examples
+    --------
+    >>> locate('os.path.join') is os.path.join
+    True
+    """
+    return pydoc.locate(obj_namespace)
 
 
 def unique(v:Iterable) -> list:
@@ -81,11 +150,18 @@ def unique(v:Iterable) -> list:
     >>> unique(['foo', 'foo'])
     ['foo']
     """
-    u = []
-    for x in v:
-        if x not in u:
-            u.append(x)
-    return u
+    # materialize iterators so we can go through the items again if needed
+    items = v if isinstance(v, (list, tuple)) else list(v)
+    # dicts preserve the insertion order
+    try:
+        return list(dict.fromkeys(items))
+    # case of unhashable items (slower)
+    except TypeError:
+        u = []
+        for x in items:
+            if x not in u:
+                u.append(x)
+        return u
 
 
 # -
@@ -98,37 +174,80 @@ class FileOperations:
     e.g. `FileOperations.list_files`.
     """
 
-    def _list_files_recursive(folder:str, pattern:re.Pattern) -> List[str]:
+    def _get_name_matcher(pattern:Union[re.Pattern, Tuple[str, ...]]) -> Callable[[str], bool]:
+        """
+        Returns a function that tells if a file name matches `pattern`
+        which is either a regex pattern or a tuple of suffixes (case sensitive).
+        For the patterns of template files (`Patterns.template_files`
+        and `Patterns.template_files_insensitive`) `str.endswith`
+        is used as well since it is much cheaper than a regex search.
+        """
+        ext = Patterns.template_files_suffixes
+        if isinstance(pattern, tuple):
+            return lambda name: name.endswith(pattern)
+        elif pattern is Patterns.template_files:
+            return lambda name: name.endswith(ext)
+        elif pattern is Patterns.template_files_insensitive:
+            return lambda name: name.lower().endswith(ext)
+        return pattern.search
+
+    def _iter_files_recursive(folder:str, pattern:Union[re.Pattern, Tuple[str, ...]]) -> Iterator[str]:
         """
-        Lists files whose name match `pattern` in a folder and its subfolders
+        Yields files whose name match `pattern` in a folder and its subfolders
+        (like `os.walk`, symlinks to folders are not followed, folders that cannot
+        be read e.g. missing folders or folders without permissions are skipped and
+        the files of a folder come before the files of its subfolders)
         """
-        filepaths = []
-        for root, dirs, files in os.walk(folder):
-            for f in files:
+        matches = FileOperations._get_name_matcher(pattern)
+        # walk stack instead of os.walk so we can use the DirEntry objects
+        # of os.scandir (file type is known without an extra stat call)
+        folders = [folder]
+        while folders:
+            try:
+                with os.scandir(folders.pop()) as it:
+                    entries = list(it)
+            except OSError:  # same as `os.walk` with `onerror=None`
+                continue
+            subfolders = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subfolders.append(entry.path)
                 # search pattern inside of file name
-                if pattern.search(Path(f).name):
-                    fullpath = os.path.join(root, f)
-                    filepaths.append(fullpath)
-        return filepaths
+                elif matches(entry.name) and not entry.is_dir():
+                    yield entry.path
+            # the stack is last in first out so we add the subfolders in reverse
+            # to walk them in the order they were found (same as `os.walk`)
+            folders.extend(reversed(subfolders))
 
-    def _list_files_non_recursive(folder:str, pattern:re.Pattern) -> List[str]:
+    def _iter_files_non_recursive(folder:str, pattern:Union[re.Pattern, Tuple[str, ...]]) -> Iterator[str]:
         """
-        Lists files whose name match `pattern` in a folder but **not** in its subfolders
+        Yields files whose name match `pattern` in a folder but **not** in its subfolders
         """
-        return [os.path.join(folder, f) for f in os.listdir(folder)
-                if pattern.search(Path(f).name)]
+        matches = FileOperations._get_name_matcher(pattern)
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if matches(entry.name) and not entry.is_dir():
+                    yield entry.path
 
-    def list_files(folder:str, pattern:re.Pattern, recursive:bool=True) -> List[str]:
+    def iter_files(folder:str, pattern:Union[re.Pattern, Tuple[str, ...]], recursive:bool=True) -> Iterator[str]:
         """
-        Lists files whose name match `pattern` in a `folder` and optionally in its subfolders
-        (when `recursive=True`)
+        Lazy version of method `list_files` (see its docstring): the paths are yielded
+        while the folders are being scanned instead of being collected in a list
         """
         if recursive:
-            f = FileOperations._list_files_recursive
+            f = FileOperations._iter_files_recursive
         else:
-            f = FileOperations._list_files_non_recursive
+            f = FileOperations._iter_files_non_recursive
         return f(folder=folder, pattern=pattern)
 
+    def list_files(folder:str, pattern:Union[re.Pattern, Tuple[str, ...]], recursive:bool=True) -> List[str]:
+        """
+        Lists files whose name match `pattern` in a `folder` and optionally in its subfolders
+        (when `recursive=True`). `pattern` can be a regex pattern or a tuple of suffixes
+        (e.g. `('.md', '.npmd')`, case sensitive)
+        """
+        return list(FileOperations.iter_files(folder=folder, pattern=pattern, recursive=recursive))
+
     def switch_folder(source_folder:str, destination_folder:str,
                       filepath:str, create_missing_dirs:bool=True) -> str:
         """
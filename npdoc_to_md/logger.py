@@ -33,6 +33,22 @@ log_method_switch = {logging.CRITICAL:LoggingLevel(method_name='critical', color
                      logging.WARNING:LoggingLevel(method_name='warning', color="\x1b[33;20m"),  # yellow
                      logging.INFO:LoggingLevel(method_name='info', color="\x1b[38;20m"),  # grey
                      logging.DEBUG:LoggingLevel(method_name='debug', color="\x1b[1;34m")}  # blue
+# extra attributes of the log records for each level (built once instead of for every log call)
+log_extras = {level:{'color':log_level.color} for level, log_level in log_method_switch.items()}
+
+
+class ColoredFormatter(logging.Formatter):
+    """
+    Formats log records with the color of their level (see `log_method_switch`).
+    The line is built with a f-string instead of the %-style template
+    of `logging.Formatter` (the exception info is still handled by the
+    parent class)
+    """
+
+    def formatMessage(self, record:logging.LogRecord) -> str:
+        return (f'{record.color}{self.formatTime(record)} | {record.levelname}     '
+                f'| {record.name}    | {record.module}:{record.funcName}:{record.lineno} '
+                f'- {record.message}{reset_color}')
 
 
 # -
@@ -73,27 +89,34 @@ def log(text:str, name:str='npdoc_to_md', level:int=logging.INFO, exc_info:bool=
     >>> # this will log something
     >>> log('warn', level=logging.WARNING) # doctest: +SKIP
     """
-    # get the appropriate log method (info, warning etc.)
+    # get the appropriate color (and validate the level)
     try:
-        log_level:LoggingLevel = log_method_switch[level]
+        extra = log_extras[level]
     except KeyError:  # pragma: no cover
         raise ValueError(f'{level} is not a valid log level. See https://docs.python.org/3/library/logging.html')
 
-    # environment variable so user can customize the logging level of the library
-    logger_level = os.getenv('NPDOC_TO_MD_LOG_LEVEL', logging.INFO)
-    logger_level = int(logger_level) if isinstance(logger_level, str) else logger_level
-
     # init logger
-    if name not in loggers:
+    _logger = loggers.get(name)
+    if _logger is None:
+        # environment variable so user can customize the logging level of the library
+        # (only read once, when the logger is created)
+        logger_level = os.getenv('NPDOC_TO_MD_LOG_LEVEL', logging.INFO)
+        logger_level = int(logger_level) if isinstance(logger_level, str) else logger_level
+
         _logger = logging.getLogger(name)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(color)s%(asctime)s | %(levelname)s     '
-                                      '| %(name)s    | %(module)s:%(funcName)s:%(lineno)s '
-                                      f'- %(message)s{reset_color}')
-        handler.setFormatter(formatter)
-        _logger.addHandler(handler)
+        # the logger may already be configured e.g. if this module was reloaded
+        # (we do not want to add another handler which would duplicate every log line)
+        if not _logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(ColoredFormatter())
+            _logger.addHandler(handler)
         _logger.setLevel(logger_level)
         loggers[name] = _logger
 
+    # skip messages that would be discarded anyway
+    # (`isEnabledFor` is cached by the logging library)
+    if not _logger.isEnabledFor(level):
+        return
+
     # log
-    getattr(loggers[name], log_level.method_name)(msg=text, exc_info=exc_info, extra={'color': log_level.color})
+    _logger.log(level, msg=text, exc_info=exc_info, extra=extra)
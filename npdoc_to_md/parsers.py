@@ -8,11 +8,11 @@ See sections in https://numpydoc.readthedocs.io/en/latest/format.html
 """
 import dataclasses
 import inspect
-import pydoc
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field as dataclassfield
+from functools import lru_cache
 from numpydoc.docscrape import Parameter
-from typing import Any, ClassVar, List, Tuple
+from typing import Any, ClassVar, Collection, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 # local imports
 from npdoc_to_md.exceptions import (MembersConflictsException,
@@ -20,9 +20,9 @@ from npdoc_to_md.exceptions import (MembersConflictsException,
                                     NonExistentMemberException,
                                     NonExistentObjectException,
                                     SignatureNotFoundException)
-from npdoc_to_md.helpers import Patterns, unique
+from npdoc_to_md.helpers import Patterns, cached_property, locate
 from npdoc_to_md.examples_labeller import (ExampleBlock, ExamplesLabeller,
-                                           ExampleLine, ExampleLineType)
+                                           ExampleLine, ExampleLineType, console_prompts)
 from npdoc_to_md.logger import log
 from npdoc_to_md.config import MemberFlag, Config, SpecialExampleOutputLanguages
 from npdoc_to_md.sections import SectionsFinder
@@ -68,7 +68,9 @@ def param_description_lines_to_md_lines(desc_lines:List[str]) -> List[str]:
     Note that using &nbsp; and such is bad idea because we'd have to understand when markdown
     needs a new line or not (with tables and such it gets complicated quickly...)
     """
-    return [(' ' * 2) + line if line.strip() else line for line in desc_lines]
+    # `str.isspace` does not create a new string like `str.strip` would
+    # (it also returns False for an empty string hence the first check)
+    return [line if not line or line.isspace() else '  ' + line for line in desc_lines]
 
 
 # -
@@ -124,18 +126,31 @@ class MembersParser:
     members_parsed:Tuple[str] = dataclassfield(init=False)
     allowed_flags:ClassVar[Tuple[str]] = tuple(f.value for f in MemberFlag)
     _all_members:List[str] = dataclassfield(init=False, repr=False)
+    _all_members_set:FrozenSet[str] = dataclassfield(init=False, repr=False)
+
+    @cached_property
+    def _members_by_flag(self) -> Dict[str, List[str]]:
+        """
+        Helper for method `_parse_flag`, classifies all the members
+        of the object (dunder, private or public) in a single pass
+        """
+        dunder, private, public = [], [], []
+        for v in self._all_members:
+            if v.startswith('__'):
+                dunder.append(v)
+            elif v.startswith('_'):
+                private.append(v)
+            else:
+                public.append(v)
+        return {MemberFlag.DUNDER.value:dunder, MemberFlag.PRIVATE.value:private, MemberFlag.PUBLIC.value:public}
 
     def _parse_flag(self, flag:str) -> List[str]:
         """
         Helper for __post_init__
         """
-        if flag == MemberFlag.DUNDER.value:
-            return [v for v in self._all_members if v.startswith('__')]
-        elif flag == MemberFlag.PRIVATE.value:
-            return [v for v in self._all_members if v.startswith('_') and not v.startswith('__')]
-        elif flag == MemberFlag.PUBLIC.value:
-            return [v for v in self._all_members if not v.startswith('_')]
-        else:
+        try:
+            return self._members_by_flag[flag]
+        except KeyError:
             raise InvalidMembersFlagException('Flags for documenting members must be one of: '
                                               f'{self.allowed_flags}. Got: "{flag}"')
 
@@ -145,7 +160,7 @@ class MembersParser:
         """
         # handle case of included with "+" syntax
         value = value[1:] if value.startswith('+') else value
-        if value not in self._all_members:
+        if value not in self._all_members_set:
             raise NonExistentMemberException(f'Object {self.obj} does not have any attribute: "{value}"')
         return value
 
@@ -157,6 +172,8 @@ class MembersParser:
                              f'Value of parameter `members` was: {members}')
         object.__setattr__(self, 'members', members)
         object.__setattr__(self, '_all_members', dir(self.obj))  # this is for avoiding many calls to `dir`
+        # set for fast membership tests (the list above keeps the order of the members)
+        object.__setattr__(self, '_all_members_set', frozenset(self._all_members))
 
         candidates = []
         exclusions = []
@@ -173,19 +190,27 @@ class MembersParser:
                 inclusions.append(parsed)
 
         # case when we have members both excluded and included
-        conflicts = set(exclusions) & set(inclusions)
+        exclusions = set(exclusions)
+        conflicts = exclusions & set(inclusions)
         if conflicts:
             raise MembersConflictsException(f'The following members in object {self.obj} are set to be '
                                             f'included AND excluded: {conflicts}')
 
         # finalize parsing
-        parsed_members = [c for c in unique(candidates) if c not in exclusions]
-        object.__setattr__(self, 'parsed_members', tuple(parsed_members))
+        # (the names of the members are hashable so we can dedupe in order with `dict.fromkeys`)
+        parsed_members = tuple(c for c in dict.fromkeys(candidates) if c not in exclusions)
+        object.__setattr__(self, 'parsed_members', parsed_members)
 
 
 # ## Base parsers for numpy sections
 
 # +
+# default configuration shared by the parsers instead of creating
+# a new one for each parser. This is safe because the configuration is
+# a frozen dataclass that stores its members as a tuple (fully immutable)
+default_config = Config()
+
+
 @dataclass(frozen=True)
 class DocParser(ABC):
     '''
@@ -230,7 +255,7 @@ class DocParser(ABC):
     ['Sum of two integers']
     '''
     lines:list
-    config:Config = dataclassfield(default_factory=lambda: Config())
+    config:Config = default_config
 
     @abstractmethod
     def to_md_lines(self) -> List[str]:
@@ -273,13 +298,13 @@ class PyObjParser(ABC):
     '**numpydoc.docscrape.NumpyDocString**_(docstring, config=None)_'
     '''
     obj_namespace:str = dataclassfield(default=None)
-    config:Config = dataclassfield(default_factory=lambda: Config())
+    config:Config = default_config
     sig_name:str = dataclassfield(init=False)
     obj:Any = dataclassfield(init=False)
 
     def __post_init__(self):
         # get Python object
-        obj = pydoc.locate(self.obj_namespace)
+        obj = locate(self.obj_namespace)
         # we handle the unlikely case where the user actually was refering to "None"
         if obj is None and self.obj_namespace not in ('builtins.None', 'None'):
             raise NonExistentObjectException(f'Could not load Python object "{self.obj_namespace}"')
@@ -333,11 +358,12 @@ class ExampleBlockHandler:
     block:ExampleBlock
     config:Config
 
-    @property
+    @cached_property
     def output_lang(self):
         # output langs indicated directly in examples
         # e.g. {{python}} will override the parameter
         # `examples_md_lang` (as explained in the wiki of the library)
+        # this is cached because it is used for every output line of the block
         if self.block.output_lang is None:
             lang:str = self.config.examples_md_lang
             # there should always be a default lang, this cannot be None or such
@@ -363,7 +389,8 @@ class ExampleBlockHandler:
 
         # clean the output line before adding it
         line = example_line.line
-        if self.config.remove_doctest_blanklines:
+        # cheap substring check first (most lines are not blank lines of doctest)
+        if self.config.remove_doctest_blanklines and '<BLANKLINE>' in line:
             line = Patterns.blankline.sub(repl='', string=line)
         new_lines.append(line)
 
@@ -386,9 +413,12 @@ class ExampleBlockHandler:
 
         # clean and then add line
         line = example_line.line
-        if self.config.remove_doctest_skip:
+        # cheap substring check first (same as for doctest blank lines in `_output_line_to_md`)
+        if self.config.remove_doctest_skip and 'doctest' in line:
             line = Patterns.doctest_skip.sub(repl='', string=line)
-        new_lines.append(Patterns.console_py.sub(repl='', string=line))
+        # input lines always begin with a prompt (">>>" or "...", see `ExamplesLabeller`)
+        # optionally followed by a space so we can slice it away (same as `Patterns.console_py.sub`)
+        new_lines.append(line[4:] if line[3:4] == ' ' else line[3:])
 
         # add markdown syntax for end of code block
         if example_line.global_index == self.block.ix_last_input:
@@ -403,10 +433,11 @@ class ExampleBlockHandler:
                         ExampleLineType.INPUT:self._input_line_to_md,
                         ExampleLineType.OUTPUT:self._output_line_to_md}
         new_lines = []
+        extend = new_lines.extend  # bound once (called for every line)
         for example_line in self.block.example_lines:
             # get the appropriate function then pass the example line object
             f = transformers[example_line.line_type]
-            new_lines.extend(f(example_line=example_line))
+            extend(f(example_line))
         return new_lines
 
 
@@ -420,6 +451,18 @@ class ExampleParser(DocParser):
     def to_md_lines(self) -> List[str]:
         # precision on the expected types inside the list `self.lines`
         self.lines:List[str]
+
+        # fast path for sections without any input (prose only): all the lines are text
+        # that we keep as is except the placeholders for the language of outputs
+        # which we drop (same result as going through `ExampleBlockHandler`)
+        if not any(line.startswith(console_prompts) for line in self.lines):
+            new_lines = []
+            for line in self.lines:
+                stripped = line.strip()
+                if not (stripped.startswith('{{') and stripped.endswith('}}')):
+                    new_lines.append(line)
+            return new_lines
+
         new_lines = []
         blocks:List[ExampleBlock] = ExamplesLabeller(lines=self.lines).example_blocks
         for block in blocks:
@@ -443,12 +486,11 @@ class ParametersLikeSectionParser(DocParser):
     def _param_to_md_lines(self, param:Parameter) -> List[str]:
         new_lines:List[str] = []
 
-        # get name and type and escape them
-        name = MdEscaper.escape(param.name).strip()
-        name = f'**{name}**' if name != '' else ''
+        # get name and type and escape them (only when they are not empty)
+        name = param.name.strip()
+        name = f'**{MdEscaper.escape(name)}**' if name != '' else ''
         type_ = param.type.strip()
-        type_ = MdEscaper.escape(type_)
-        type_ = f"**_{param.type}_** " if param.type != '' else ''
+        type_ = f'**_{MdEscaper.escape(type_)}_** ' if type_ != '' else ''
         prefix = '* ' if name != '' or type_ != '' else ''
 
         # get separator between name and type
@@ -551,17 +593,47 @@ class SignatureParser(PyObjParser):
         >>> SignatureParser.get_signature(render_string)
         '(string: str, ignore_errors: bool = False) -> str'
         """
+        return str(SignatureParser._get_signature_obj(obj))
+
+    @staticmethod
+    def _get_signature_obj(obj:Any) -> inspect.Signature:
+        """
+        Same as method `get_signature` but returns an instance of inspect.Signature
+        """
         assert callable(obj), f'Trying to get signature of non callable object: {obj}'
 
         try:
             # this will fail for builtins written in C but the except part will handle that
-            return str(inspect.signature(obj))
+            return inspect.signature(obj)
         except ValueError as e:
             if hasattr(obj, '__init__'):
-                return str(inspect.signature(obj.__init__))
+                return inspect.signature(obj.__init__)
             else:
                 raise SignatureNotFoundException(f'Cannot get signature of object {obj}') from e  # pragma: no cover
 
+    @staticmethod
+    def get_clean_signature(obj:Any) -> str:
+        """
+        Gets the signature of given object as a string (see method `get_signature`)
+        without the argument self or cls and escaped for Markdown.
+
+        `inspect.signature` is slow so results are cached for hashable objects.
+
+        Examples
+        --------
+        >>> class Foo:
+        ...     def bar(self, a:int, b:int=1) -> None:
+        ...         pass
+        >>> SignatureParser.get_clean_signature(Foo.bar)
+        '(a: int, b: int = 1) -> None'
+        """
+        try:
+            hash(obj)
+        except TypeError:
+            return _get_clean_signature(obj)
+        # the type is part of the key so that equal objects of different types are not mixed up
+        return _get_clean_signature_cached(type(obj), obj)
+
     def to_md_lines(self) -> List[str]:
         name = MdEscaper.escape(self.sig_name)
         name_colored = f'<span style="color:purple">{name}</span>'
@@ -574,11 +646,30 @@ class SignatureParser(PyObjParser):
             return [f'{"#" * level} {name_colored}']
 
         # get signature string and "clean" it (remove self or cls argument)
-        sig_str = self.get_signature(obj=self.obj)
-        sig_str = MdEscaper.escape(Patterns.self_or_cls.sub(repl='', string=sig_str))
+        sig_str = self.get_clean_signature(obj=self.obj)
         return [f'{"#" * level} {name_colored}_{sig_str}_']
 
 
+def _get_clean_signature(obj:Any) -> str:
+    """
+    See method `SignatureParser.get_clean_signature`
+    """
+    sig = SignatureParser._get_signature_obj(obj=obj)
+    # remove the first parameter if it is "self" or "cls"
+    params = list(sig.parameters.values())
+    if params and params[0].name in ('self', 'cls'):
+        sig = sig.replace(parameters=params[1:])
+    return MdEscaper.escape(str(sig))
+
+
+@lru_cache(maxsize=2048)
+def _get_clean_signature_cached(obj_type:type, obj:Any) -> str:
+    """
+    See method `SignatureParser.get_clean_signature`
+    """
+    return _get_clean_signature(obj)
+
+
 # # Class to parse every section
 
 # +
@@ -606,18 +697,19 @@ class ParserEngine(PyObjParser):
     a numpydoc docstring to Markdown
     """
 
-    def section_to_md_lines(self, sections_finder:SectionsFinder, section:str) -> List[str]:
+    def _section_to_md_lines(self, section:str, lines:list, visible_sections:Collection[str]) -> List[str]:
         """
-        Converts any `section` of a numpydoc style docstring to markdown lines
+        Does the actual work of method `section_to_md_lines` using the content of the section
+        and the visible sections of the docstring (see `SectionsFinder.all_visible_sections`)
+        so that they can be retrieved once for all the sections (see method `to_md_lines`)
         """
         # skip empty sections (except for "Signature" which is done using `inspect.signature`)
-        lines = sections_finder[section]
         if section != 'Signature' and not len(lines):
             return []
 
         # handle bug where a section does not exists and it is still parsed by numpydoc
         # for instance this happened with the section Attributes of pd.DataFrame
-        if section not in sections_finder.sections_without_headers and section not in sections_finder.all_visible_sections:
+        if section not in SectionsFinder.sections_without_headers and section not in visible_sections:
             return []
 
         # get and instantiate parser class
@@ -632,9 +724,22 @@ class ParserEngine(PyObjParser):
                             'npdoc_to_md.parser.PyObjParser')
         return parser.to_md_lines()
 
-    def to_md_lines(self) -> List[str]:
+    def section_to_md_lines(self, sections_finder:SectionsFinder, section:str) -> List[str]:
+        """
+        Converts any `section` of a numpydoc style docstring to markdown lines
+        """
+        return self._section_to_md_lines(section=section, lines=sections_finder[section],
+                                         visible_sections=sections_finder.all_visible_sections)
+
+    def _iter_sections_md_lines(self) -> Iterator[Tuple[Optional[str], List[str]]]:
+        """
+        Yields the header (None for sections without headers) and the Markdown lines
+        of each non empty section in order of appearance (see methods `to_md_lines`
+        and `to_md_string`)
+        """
         # initialize tool to find sections
-        sections_finder = SectionsFinder(self.obj, ignore_custom_section_warning=self.config.ignore_custom_section_warning)
+        sections_finder = SectionsFinder.from_obj(self.obj,
+                                                  ignore_custom_section_warning=self.config.ignore_custom_section_warning)
         custom_section_names = list(sections_finder.custom_sections.keys())
         if len(custom_section_names):
             log(f'Found the following custom sections {custom_section_names} in object {self.obj}.\n'
@@ -642,35 +747,81 @@ class ParserEngine(PyObjParser):
                 '"Summary" and "Extended Summary")')
 
         # convert each section in order of appearance to markdown
-        new_lines = []
-        for section in sections_finder.all_sections:
-            new_lines_sublist = self.section_to_md_lines(sections_finder=sections_finder, section=section)
+        # (the sections and their content are retrieved only once)
+        visible_sections = frozenset(sections_finder.all_visible_sections)
+        for section, lines in sections_finder.all_sections.items():
+            new_lines_sublist = self._section_to_md_lines(section=section, lines=lines,
+                                                          visible_sections=visible_sections)
             # after converting if we end up with an empty list we'll skip it
             if not len(new_lines_sublist):
                 continue
+            header = None if section in sections_finder.sections_without_headers else section
+            yield header, new_lines_sublist
 
+    def to_md_lines(self) -> List[str]:
+        new_lines = []
+        for header, new_lines_sublist in self._iter_sections_md_lines():
             # add a header and two line breaks (only one is needed but this is
             # prettier for the non rendered version since you'll have a separation line
             # below the section)
-            if section not in sections_finder.sections_without_headers:
-                new_lines.append(f'{self.config.md_section_level*"#"} {section}\n\n')
+            if header is not None:
+                new_lines.append(f'{self.config.md_section_level*"#"} {header}\n\n')
 
             # add the new lines
             new_lines.append('\n'.join(new_lines_sublist) + '\n\n')
         return new_lines
 
+    def _to_flat_md_lines(self) -> List[str]:
+        """
+        Same as method `to_md_lines` but returns a flat list of lines (the
+        headers, the lines of the sections and empty lines between them) so
+        that `to_md_string` can join all the lines at once
+        """
+        new_lines = []
+        for header, new_lines_sublist in self._iter_sections_md_lines():
+            # header and empty line (see `to_md_lines`)
+            if header is not None:
+                new_lines.extend((f'{self.config.md_section_level*"#"} {header}', ''))
+
+            # add the new lines and an empty line to separate the sections
+            new_lines.extend(new_lines_sublist)
+            new_lines.append('')
+        return new_lines
+
     def to_md_string(self) -> str:
         """
-        Creates a single Markdown string using the output of method
-        `to_md_lines`
+        Creates a single Markdown string using the same lines as method
+        `to_md_lines` (all the lines are joined at once)
         """
-        return ''.join(self.to_md_lines()).strip()
+        return '\n'.join(self._to_flat_md_lines()).strip()
 
 
 # -
 
 # # Main function
 
+def _render_engine(engine:ParserEngine) -> str:
+    """
+    Returns the rendering of the object of given engine (without its members).
+
+    When the disk cache is enabled (see module `npdoc_to_md._cache`) the rendering
+    is looked up and saved there. There is one cached rendering per object (not one
+    for an object and all its members) so that the key of each rendering covers the
+    docstring and source file of the object it was made from.
+    """
+    # the disk cache is optional, no need to import its dependencies (hashlib, pickle, ...) beforehand
+    from npdoc_to_md import _cache
+
+    if _cache.get_cache_dir() is None:
+        return engine.to_md_string()
+    key = _cache.make_key(obj_namespace=engine.obj_namespace, config=engine.config)
+    md = _cache.get(key)
+    if md is None:
+        md = engine.to_md_string()
+        _cache.put(key, md)
+    return md
+
+
 def parse_and_render(obj_namespace:str, config:Config) -> str:
     """
     Loads object at given namespace (`obj_namespace`)
@@ -680,22 +831,22 @@ def parse_and_render(obj_namespace:str, config:Config) -> str:
     """
     # case of a single item to parse
     engine = ParserEngine(obj_namespace=obj_namespace, config=config)
-    result = engine.to_md_string()
+    result = _render_engine(engine)
     if config.members is None or len(config.members) == 0:
         return result
 
     # parse members
     results = [result]
     parsed_members = MembersParser(obj=engine.obj, members=config.members).parsed_members
+    # we have to make a few changes to the config for members: no members i.e. an empty
+    # tuple like the default of `Config.members` (shallow copy with `dataclasses.replace`, no need for a deep copy with `dataclasses.asdict`)
+    # and an alias for each member if there is one (otherwise all members share the same config)
+    members_config = dataclasses.replace(config, members=())
     for member in parsed_members:
-
-        # we have to make a few changes to the config for members
-        config_dict = dataclasses.asdict(config)
-        config_dict.pop('members')
-
-        if config_dict['alias'] is not None:
-            config_dict['alias'] = f"{config_dict['alias']}.{member}"
-        new_config = Config(**config_dict)
-        results.append(ParserEngine(obj_namespace=f'{obj_namespace}.{member}', config=new_config).to_md_string())
+        if config.alias is None:
+            new_config = members_config
+        else:
+            new_config = dataclasses.replace(members_config, alias=f'{config.alias}.{member}')
+        results.append(_render_engine(ParserEngine(obj_namespace=f'{obj_namespace}.{member}', config=new_config)))
 
     return '\n\n'.join(results)
@@ -2,31 +2,45 @@
 """
 Tools for finding and parsing placeholders described in the wiki of the library
 """
-import json
 import logging
+from functools import lru_cache
 from dataclasses import dataclass, field as dataclass_field
-from typing import ClassVar, Tuple
+from types import MappingProxyType
+from typing import ClassVar, FrozenSet, Mapping, Tuple
 
 # local imports
 from npdoc_to_md.config import Config
+from npdoc_to_md.helpers import Patterns
 from npdoc_to_md.logger import log
 
+# use the faster JSON parser orjson if it is installed (optional dependency)
+# note that its exceptions subclass the ones of the json module
+try:
+    from orjson import loads as json_loads
+except ModuleNotFoundError:  # pragma: no cover
+    from json import loads as json_loads
+
 
 # -
 
 # # Placeholder class
 
-@dataclass
+@dataclass(frozen=True)
 class Placeholder:
     """
     Helper for finding placeholders defined by this library in strings or markdown files.
 
+    Instances are immutable (the attribute `parsed` is a read-only mapping) because
+    the same instance is returned for the same line (see method `_from_line`).
+
     Attributes
     ----------
     required
         Mandatory parameters for placeholders
     optional
         Optional parameters for placeholders
+    allowed_keys
+        Union of `required` and `optional` (for fast membership tests)
 
     Examples
     --------
@@ -38,18 +52,24 @@ class Placeholder:
     ...     if placeholder:
     ...         print(placeholder.obj_namespace, placeholder.config, sep=' | ')
     pandas.DataFrame | Config(alias='pd.DataFrame', examples_md_lang='python', remove_doctest_blanklines=True, \
-remove_doctest_skip=False, md_section_level=3, ignore_custom_section_warning=False, members=[])
+remove_doctest_skip=False, md_section_level=3, ignore_custom_section_warning=False, members=())
+
+    >>> placeholder.parsed['obj'] = 'pandas.Series'
+    Traceback (most recent call last):
+    ...
+    TypeError: 'mappingproxy' object does not support item assignment
     """
     line:str
-    parsed:dict = dataclass_field(init=False)
+    parsed:Mapping = dataclass_field(init=False)
     obj_namespace:str = dataclass_field(init=False)
     config:Config = dataclass_field(init=False)
     required:ClassVar[Tuple[str]] = ('obj',)
     optional:ClassVar[Tuple[str]] = tuple(Config.__dataclass_fields__.keys())
+    allowed_keys:ClassVar[FrozenSet[str]] = frozenset(required + optional)
 
     def __post_init__(self):
         line = self.line
-        parsed:dict = json.loads(line[1:-1])
+        parsed:dict = json_loads(line[1:-1])
 
         # validate
         # 1) mandatory keys
@@ -59,9 +79,9 @@ remove_doctest_skip=False, md_section_level=3, ignore_custom_section_warning=Fal
                              f'The faulty line was:\n{line}')
 
         # 2) extra keys (not allowed)
-        all_keys = list(self.required) + list(self.optional)
-        extra_keys = [k for k in parsed if k not in all_keys]
-        if extra_keys:
+        if not self.allowed_keys.issuperset(parsed):
+            extra_keys = [k for k in parsed if k not in self.allowed_keys]
+            all_keys = list(self.required) + list(self.optional)
             raise ValueError(f'Unexpected keys {extra_keys} in a placeholder of numpydoc_to_md. '
                              f'Allowed keys are: {all_keys}. Faulty line:\n{line}')
 
@@ -71,10 +91,21 @@ remove_doctest_skip=False, md_section_level=3, ignore_custom_section_warning=Fal
         config = Config(**kwargs)
 
         # because we are in a frozen dataclass we need this workaround to set attributes
-        object.__setattr__(self, 'parsed', parsed)
+        object.__setattr__(self, 'parsed', MappingProxyType(parsed))
         object.__setattr__(self, 'obj_namespace', obj_namespace)
         object.__setattr__(self, 'config', config)
 
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _from_line(cls, line:str) -> 'Placeholder':
+        """
+        Cached instantiation of the class so that a placeholder used multiple times
+        (e.g. in different files) is only parsed and validated once.
+        Exceptions are not cached. Note that the same instance is returned for
+        the same line (this is fine since instances are immutable).
+        """
+        return cls(line=line)
+
     @classmethod
     def search(cls, line:str) -> 'Placeholder':
         """
@@ -83,8 +114,7 @@ remove_doctest_skip=False, md_section_level=3, ignore_custom_section_warning=Fal
         of the class.
         Otherwise we return None.
         """
-        line = line.strip()
-        return cls(line=line) if line.startswith('{{') and line.endswith('}}') else None
+        return cls._from_line(line.strip()) if Patterns.placeholder.match(line) else None
 
     @classmethod
     def search_no_err(cls, line:str) -> 'Placeholder':
@@ -112,13 +142,13 @@ remove_doctest_skip=False, md_section_level=3, ignore_custom_section_warning=Fal
         >>> print(placeholder)
         None
         """
-        line = line.strip()
         # case where it is definitely not a placeholder
-        if not (line.startswith('{{') and line.endswith('}}')):
+        if not Patterns.placeholder.match(line):
             return None
+        line = line.strip()
         # try to parse the placeholder
         try:
-            return cls(line=line)
+            return cls._from_line(line)
         except Exception:
             log(f'An exception occured when rendering this placeholder: {line}',
                 level=logging.ERROR, exc_info=True)
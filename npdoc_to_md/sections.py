@@ -1,12 +1,13 @@
 # +
 import inspect
 import warnings
+from functools import lru_cache
 from dataclasses import dataclass, field as dataclassfield
 from typing import Any, ClassVar, Dict, List, Tuple, Union
 from numpydoc.docscrape import ClassDoc, FunctionDoc, NumpyDocString
 
 # local imports
-from npdoc_to_md.helpers import previous_current_next
+from npdoc_to_md.helpers import Patterns, cached_property
 
 
 # -
@@ -18,7 +19,11 @@ class SectionsFinder:
     '''
     Gets all numpydoc style sections in a Python object's docstring
     **including custom defined sections** (numpydoc ignores them :/)
-    and in order
+    and in order.
+
+    The properties (e.g. `all_sections`) are computed only once per instance
+    (instances may be shared see `SectionsFinder.from_obj`) so the values they
+    return should not be modified.
 
     Attributes
     ----------
@@ -31,6 +36,12 @@ class SectionsFinder:
         Object from numpydoc representing a parsed docstring
     docstring_cleaned
         Docstring cleaned with inspect.cleandoc
+    docstring_lines
+        Lines of the cleaned docstring (it is only split once)
+    numpydoc_warnings
+        Warnings emitted by numpydoc when parsing the docstring (e.g. for custom
+        sections unless `ignore_custom_section_warning` is True). They are emitted
+        again for every rendering even if the instance is cached (see `from_obj`)
 
     Examples
     --------
@@ -89,16 +100,18 @@ class SectionsFinder:
     standard_section_names:ClassVar[Tuple[str]] = tuple([k for k in NumpyDocString.sections if k != 'index'])
     doc:Union[ClassDoc, FunctionDoc, NumpyDocString] = dataclassfield(init=False)
     docstring_cleaned:str = dataclassfield(init=False)
+    docstring_lines:List[str] = dataclassfield(init=False, repr=False)
+    numpydoc_warnings:Tuple[warnings.WarningMessage, ...] = dataclassfield(init=False, repr=False, compare=False)
 
     def __post_init__(self):
 
         # pyobj must be a class, function or anything else that has a docstring...
         py_obj = self.py_obj
-        if self.ignore_custom_section_warning:
-            with warnings.catch_warnings():
+        # record the warnings of numpydoc so they can be emitted again when the instance is cached
+        with warnings.catch_warnings(record=True) as numpydoc_warnings:
+            warnings.simplefilter('always')
+            if self.ignore_custom_section_warning:
                 warnings.filterwarnings(action='ignore', category=UserWarning, message='Unknown section')
-                doc = self._get_numpydoc_obj(py_obj)
-        else:
             doc = self._get_numpydoc_obj(py_obj)
 
         # clean the docstring, handle the case when there is no docstring (__doc__ is None)
@@ -108,6 +121,38 @@ class SectionsFinder:
         # because we are in a frozen dataclass we need this workaround to set attributes
         object.__setattr__(self, 'doc', doc)
         object.__setattr__(self, 'docstring_cleaned', docstring_cleaned)
+        object.__setattr__(self, 'docstring_lines', docstring_cleaned.splitlines())
+        object.__setattr__(self, 'numpydoc_warnings', tuple(numpydoc_warnings))
+        self._emit_numpydoc_warnings()
+
+    def _emit_numpydoc_warnings(self) -> None:
+        """
+        Emits the warnings recorded when parsing the docstring (see attribute `numpydoc_warnings`)
+        """
+        # no registry so they are not deduplicated like warnings that are emitted
+        # once per location, we want the same output for every rendering
+        for w in self.numpydoc_warnings:
+            warnings.warn_explicit(message=w.message, category=w.category, filename=w.filename,
+                                   lineno=w.lineno, source=w.source)
+
+    @classmethod
+    def from_obj(cls, py_obj:Any, ignore_custom_section_warning:bool=False) -> 'SectionsFinder':
+        """
+        Same as instantiating the class but instances are cached for hashable objects
+        so that the docstring of an object rendered multiple times (e.g. with different
+        configurations) is only parsed once by numpydoc.
+        Note that the same instance may be returned for the same object. The warnings
+        of numpydoc (see attribute `numpydoc_warnings`) are emitted on every call.
+        """
+        try:
+            hash(py_obj)
+        except TypeError:
+            return cls(py_obj, ignore_custom_section_warning=ignore_custom_section_warning)
+        # the type is part of the key so that equal objects of different types
+        # (e.g. 1 and True) are not mixed up
+        sections_finder = _cached_sections_finder(type(py_obj), py_obj, ignore_custom_section_warning)
+        sections_finder._emit_numpydoc_warnings()
+        return sections_finder
 
     @staticmethod
     def _get_numpydoc_obj(py_obj:Any):
@@ -128,10 +173,6 @@ class SectionsFinder:
                             'or any other Python object that has a __doc__ attribute')
         return doc
 
-    @property
-    def docstring_lines(self):
-        return self.docstring_cleaned.splitlines()
-
     @staticmethod
     def _find_from_lines(line:str, next_line:Union[str, None]) -> Union[str, None]:
         """
@@ -150,15 +191,15 @@ class SectionsFinder:
         # skip empty lines
         if next_line is None:  # last line -> cannot be a section
             return None
-        if not len(line.strip()) or not len(next_line.strip()):
-            return None
-
         # do an rstrip, we still need leading spaces on the left
         # to handle cases where the section separator is misaligned
+        # (each line is only stripped once, the rstripped lines are used below)
         line, next_line = line.rstrip(), next_line.rstrip()
+        if not line or not next_line:
+            return None
 
         # check if first letter is uppercase (otherwise we consider that's not a section)
-        if not line.strip()[0].isupper():
+        if not line.lstrip()[0].isupper():
             return None
 
         # if the length is not the same, then there is necessarily a misalignement
@@ -174,7 +215,7 @@ class SectionsFinder:
         # on the docstring
         header_reached = False
         section_name_chars = []
-        for ix, (pc, c) in enumerate(zip(line.rstrip(), next_line.rstrip())):
+        for ix, (pc, c) in enumerate(zip(line, next_line)):
             # check if we reached the header
             if not header_reached:
                 header_reached = pc != ' '
@@ -193,7 +234,7 @@ class SectionsFinder:
             if ix == (nb_chars - 1):
                 return ''.join(section_name_chars)
 
-    @property
+    @cached_property
     def all_visible_sections_start_indices(self) -> Dict[int, str]:
         """
         Returns a dictionary of visible section names and where they
@@ -201,44 +242,45 @@ class SectionsFinder:
         """
         sections = {}
         lines = self.docstring_lines
-        # case of empty docstring
-        if not len(lines):
-            return {}
-        # normal case
-        for ix, (_, line, next_line) in enumerate(previous_current_next(lines)):
-            section_name:Union[str, None] = self._find_from_lines(line=line, next_line=next_line)
+        # a section header is always followed by a line of "-" or "=" (e.g. "----------")
+        # so we only need to check the lines preceding such lines
+        for ix in range(len(lines) - 1):
+            next_line = lines[ix + 1]
+            if not Patterns.section_underline.match(next_line):
+                continue
+            section_name:Union[str, None] = self._find_from_lines(line=lines[ix], next_line=next_line)
             if section_name is not None:
                 sections[section_name] = ix
         return sections
 
-    @property
+    @cached_property
     def all_visible_sections_ranges(self) -> Dict[str, range]:
         """
         Returns a dictionary of visible section names and their span
         (see class Examples)
         """
         # Example for the values of variables below:
-        # start_indices = {5:'Parameters', 10:'Examples'}
+        # sections_indices = {'Parameters':5, 'Examples':10}
+        # starts = [5, 10]
         # shifted = [10, 25]
-        # ranges = [range(5, 9), range(10, 25)]
-        # return {'Parameters':range(5, 9), 'Examples':range(10, 25)}
+        # return {'Parameters':range(7, 9), 'Examples':range(12, 24)}
         sections_indices = self.all_visible_sections_start_indices
         if not len(sections_indices):
             return {}
-        shifted = list(sections_indices.values())[1:] + [len(self.docstring_lines)]
-        assert len(sections_indices) == len(shifted)
+        # same length as `sections_indices` by construction
+        starts = list(sections_indices.values())
+        shifted = starts[1:] + [len(self.docstring_lines)]
         # start + 2 because we need to remove the header and the separator line
-        ranges = [range(a + 2, b - 1) for a, b in zip(sections_indices.values(), shifted)]
-        return {v:r for r, v in zip(ranges, sections_indices.keys())}
+        return {name:range(a + 2, b - 1) for name, a, b in zip(sections_indices, starts, shifted)}
 
-    @property
+    @cached_property
     def all_visible_sections(self) -> List[str]:
         """
         Returns a list of all visible sections
         """
         return list(self.all_visible_sections_ranges)
 
-    @property
+    @cached_property
     def custom_sections(self) -> Dict[str, List[str]]:
         """
         Returns a dict of custom sections and their content (see class Examples)
@@ -250,14 +292,14 @@ class SectionsFinder:
                 sections[section] = lines
         return sections
 
-    @property
+    @cached_property
     def standard_sections(self) -> Dict[str, list]:
         """
         Returns a dictionary similar to NumpyDocString(obj).sections
         """
         return {k:self.doc[k] for k in self.standard_section_names}
 
-    @property
+    @cached_property
     def all_sections(self) -> Dict[str, list]:
         """
         Returns a dictionary with standard sections from numpydoc AND
@@ -304,6 +346,16 @@ class SectionsFinder:
         return all_sections
 
     def __getitem__(self, key:str):
-        # that's not particulary efficient since the property
-        # will be computed each time but it's not a big deal
+        # the property is only computed once (see class docstring)
         return self.all_sections[key]
+
+
+@lru_cache(maxsize=256)
+def _cached_sections_finder(py_obj_type:type, py_obj:Any, ignore_custom_section_warning:bool) -> SectionsFinder:
+    """
+    See method `SectionsFinder.from_obj` (which emits the warnings of numpydoc
+    for cached and new instances alike so they are not emitted here)
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return SectionsFinder(py_obj, ignore_custom_section_warning=ignore_custom_section_warning)
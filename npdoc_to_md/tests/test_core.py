@@ -9,8 +9,10 @@ from dataclasses import dataclass
 from typing import Any, List, Optional
 
 # local imports
+from npdoc_to_md import _cache
 from npdoc_to_md.core import RenderedFile, render_obj_docstring, render_string, render_file, render_folder
-from npdoc_to_md.config import MemberFlag
+from npdoc_to_md.config import Config, MemberFlag
+from npdoc_to_md.helpers import locate
 from npdoc_to_md.tests.conftest import CLIRunner, CustomNamedTemporaryFile
 from npdoc_to_md.tests.expectations import (builtins_none_md,
                                             documented_func_example_md,
@@ -252,3 +254,155 @@ def test_render_docstring(test_method, runner, obj_namespace, expected):
     pt = PytestTester(obj_namespace=obj_namespace, expected=expected, rendering_options=rendering_options,
                       use_cli=runner.startswith('cli'), hyphenize=runner.endswith('hyphen'))
     getattr(pt, test_method)()
+
+
+# # Test caching
+
+def test_render_obj_docstring_cache():
+    render_obj_docstring.cache_clear()
+    first = render_obj_docstring(obj='npdoc_to_md.testing.now_utc', **RENDERING_OPTIONS)
+    second = render_obj_docstring(obj='npdoc_to_md.testing.now_utc', **RENDERING_OPTIONS)
+    assert first == second
+    # different parameters must not reuse the cached result
+    third = render_obj_docstring(obj='npdoc_to_md.testing.now_utc', md_section_level=4, **RENDERING_OPTIONS)
+    assert third != first
+    # clearing the cache must also clear the cache of located objects (e.g. for reloaded modules)
+    assert locate.cache_info().currsize > 0
+    render_obj_docstring.cache_clear()
+    assert locate.cache_info().currsize == 0
+
+
+def test_render_obj_docstring_cache_members_mutation():
+    # changing the list of members of the caller after a rendering must not reuse the cached result
+    render_obj_docstring.cache_clear()
+    obj = 'npdoc_to_md.testing.DocumentedClassExample'
+    members = [MemberFlag.PUBLIC.value]
+    first = render_obj_docstring(obj=obj, members=members, **RENDERING_OPTIONS)
+    members.append('-example_method')
+    second = render_obj_docstring(obj=obj, members=members, **RENDERING_OPTIONS)
+    assert second != first
+    header = 'DocumentedClassExample.example\\_method</span>'
+    assert header in first and header not in second
+
+
+def test_render_obj_docstring_disk_cache(monkeypatch, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    monkeypatch.setenv('NPDOC_TO_MD_CACHE_DIR', str(cache_dir))
+    render_obj_docstring.cache_clear()
+    expected = render_obj_docstring(obj='npdoc_to_md.testing.now_utc', **RENDERING_OPTIONS)
+    cached_files = [p for p in cache_dir.rglob('*') if p.is_file()]
+    assert len(cached_files) == 1
+    # alter the cached rendering to verify it is used by a new rendering
+    cached_files[0].write_text('cached', encoding='utf-8')
+    render_obj_docstring.cache_clear()
+    assert render_obj_docstring(obj='npdoc_to_md.testing.now_utc', **RENDERING_OPTIONS) == 'cached'
+    # only the renderings are deleted, not the cache folder and other files in it
+    other_file = cache_dir / 'other.txt'
+    other_file.write_text('not from npdoc_to_md', encoding='utf-8')
+    _cache.clear()
+    assert not [p for p in cache_dir.rglob('*') if p != other_file]
+    assert other_file.read_text(encoding='utf-8') == 'not from npdoc_to_md'
+    render_obj_docstring.cache_clear()
+    assert render_obj_docstring(obj='npdoc_to_md.testing.now_utc', **RENDERING_OPTIONS) == expected
+
+
+def test_render_obj_docstring_disk_cache_members(monkeypatch, tmp_path):
+    # each member is cached separately so that its own docstring and source file are part of its key
+    monkeypatch.setenv('NPDOC_TO_MD_CACHE_DIR', str(tmp_path))
+    render_obj_docstring.cache_clear()
+    obj = 'npdoc_to_md.testing.DocumentedClassExample'
+    expected = render_obj_docstring(obj=obj, members=['example_method'], **RENDERING_OPTIONS)
+    key = _cache.make_key(obj_namespace=f'{obj}.example_method', config=Config(**RENDERING_OPTIONS))
+    member_md = _cache.get(key)
+    assert member_md is not None and expected.endswith(member_md)
+    # alter the cached rendering of the member to verify it is used by a new rendering
+    _cache.put(key, 'cached member')
+    render_obj_docstring.cache_clear()
+    assert render_obj_docstring(obj=obj, members=['example_method'], **RENDERING_OPTIONS).endswith('cached member')
+
+
+# # Test rendering folders in parallel
+
+def test_render_folder_max_workers():
+    placeholder_string = PlaceholderStringGenerator.generate(obj='npdoc_to_md.testing.documented_func_example',
+                                                             **RENDERING_OPTIONS)
+    with tempfile.TemporaryDirectory() as inputdirpath, tempfile.TemporaryDirectory() as outputdirpath:
+        for name in ('Test1.npmd', 'Test2.npmd', 'Test3.md'):
+            with open(os.path.join(inputdirpath, name), mode='w', encoding='utf-8', newline='\n') as fh:
+                fh.write(f'# {name}\n{placeholder_string}')
+
+        serial = render_folder(source=inputdirpath, destination=outputdirpath)
+        parallel = render_folder(source=inputdirpath, destination=outputdirpath, max_workers=2)
+        assert len(parallel) == 3
+        # same files in the same order with the same content
+        assert parallel == serial
+        for rendered_file in parallel:
+            assert documented_func_example_md in rendered_file.rendered_text
+            with open(rendered_file.destination, mode='r', encoding='utf-8', newline='\n') as fh:
+                assert fh.read() == rendered_file.rendered_text
+
+
+# # Test rendering files line by line
+
+def test_render_file_without_text():
+    placeholder_string = PlaceholderStringGenerator.generate(obj='npdoc_to_md.testing.documented_func_example',
+                                                             **RENDERING_OPTIONS)
+    template = f'# Title\n\nSome text\n{placeholder_string}\n\nThe end\n'
+    with tempfile.TemporaryDirectory() as tmpdirpath:
+        source = os.path.join(tmpdirpath, 'Test.npmd')
+        with open(source, mode='w', encoding='utf-8', newline='\n') as fh:
+            fh.write(template)
+
+        expected = render_file(source=source).rendered_text
+        destination = os.path.join(tmpdirpath, 'Test.md')
+        rendered_file = render_file(source=source, destination=destination, return_text=False)
+        assert rendered_file.original_text is None
+        assert rendered_file.rendered_text is None
+        with open(destination, mode='r', encoding='utf-8', newline='\n') as fh:
+            assert fh.read() == expected
+
+        # rendering in place (the source is only replaced once fully rendered)
+        render_file(source=source, destination=source, return_text=False)
+        with open(source, mode='r', encoding='utf-8', newline='\n') as fh:
+            assert fh.read() == expected
+        # no temporary file left behind
+        assert sorted(os.listdir(tmpdirpath)) == ['Test.md', 'Test.npmd']
+
+
+def test_render_file_without_text_line_breaks():
+    # rendering line by line must find the same placeholders as rendering the whole text
+    # (including placeholders after line breaks other than "\n" e.g. "\r", "\x0c" or "\x1c")
+    placeholder_string = PlaceholderStringGenerator.generate(obj='npdoc_to_md.testing.documented_func_example',
+                                                             **RENDERING_OPTIONS)
+    template = f'intro\x0c{placeholder_string}\r\nA\x1c{placeholder_string}\rB\r{placeholder_string}\n'
+    with tempfile.TemporaryDirectory() as tmpdirpath:
+        source = os.path.join(tmpdirpath, 'Test.npmd')
+        with open(source, mode='w', encoding='utf-8', newline='\n') as fh:
+            fh.write(template)
+
+        expected = render_file(source=source).rendered_text
+        assert expected.count(documented_func_example_md) == 3
+        destination = os.path.join(tmpdirpath, 'Test.md')
+        render_file(source=source, destination=destination, return_text=False)
+        with open(destination, mode='r', encoding='utf-8', newline='\n') as fh:
+            assert fh.read() == expected
+
+
+# # Test preservation of line breaks
+
+def test_render_string_line_breaks():
+    placeholder_string = PlaceholderStringGenerator.generate(obj='npdoc_to_md.testing.documented_func_example',
+                                                             **RENDERING_OPTIONS)
+    text = f'# Title\r\n\r\n{placeholder_string}\r\nThe end\n'
+    assert render_string(string=text) == f'# Title\r\n\r\n{documented_func_example_md}\r\nThe end\n'
+    # text without placeholders
+    assert render_string(string='# Title\r\n\r\nThe end\n') == '# Title\r\n\r\nThe end\n'
+
+
+def test_render_string_unicode_line_breaks():
+    # lines are delimited like with `str.splitlines` so a placeholder after e.g. a form feed is rendered
+    placeholder_string = PlaceholderStringGenerator.generate(obj='npdoc_to_md.testing.documented_func_example',
+                                                             **RENDERING_OPTIONS)
+    for line_break in ('\x0b', '\x0c', '\x1c', '\x1d', '\x1e', '\x85', '\u2028', '\u2029'):
+        text = f'intro{line_break}{placeholder_string}{line_break}The end'
+        assert render_string(string=text) == f'intro{line_break}{documented_func_example_md}{line_break}The end'
@@ -20,11 +20,27 @@ from npdoc_to_md.helpers import FileOperations, Patterns
                                                             ('console_py', '...     2 + 2', '... '),
                                                             ('doctest_skip', '>>> print("hello") #doctest: +SKIP', ' #doctest: +SKIP'),
                                                             ('blankline', ' <BLANKLINE> ', ' <BLANKLINE> '),
+                                                            ('console_py', '>>>', '>>>'),
+                                                            ('console_py', 'print(">>> ")', None),
                                                             ('self_or_cls', 'Foo(self, a:int, b:int)', 'self, '),
+                                                            ('self_or_cls', 'Foo(cls)', 'cls'),
+                                                            ('self_or_cls', 'Foo(a, self)', None),
                                                             ('template_files', 'README.md', '.md'),
+                                                            ('template_files', 'README.npmd', '.npmd'),
                                                             ('template_files', 'README.MD', None),  # does not match
+                                                            ('template_files', 'README.pmd', None),
+                                                            ('template_files', 'README.nmd', None),
+                                                            ('template_files', 'README.md.bak', None),
                                                             ('template_files_insensitive', 'README.md', '.md'),
-                                                            ('template_files_insensitive', 'README.MD', '.MD')])
+                                                            ('template_files_insensitive', 'README.MD', '.MD'),
+                                                            ('section_underline', '----------', '----------'),
+                                                            ('section_underline', '  ===  ', '  ===  '),
+                                                            ('section_underline', '--- foo', None),
+                                                            ('section_underline', '', None),
+                                                            ('placeholder', '{{"obj":"foo"}}', '{{"obj":"foo"}}'),
+                                                            ('placeholder', ' {{"obj":"foo"}}  ', ' {{"obj":"foo"}}  '),
+                                                            ('placeholder', 'See {{"obj":"foo"}}', None),
+                                                            ('placeholder', '{{"obj":"foo"}} here', None)])
 def test_patterns(pattern_attr, string, expected):
     """
     Tests regex patterns listed as attributes in class npdoc_to_md.helpers.Patterns
@@ -42,22 +58,27 @@ def test_patterns(pattern_attr, string, expected):
 test_pattern_file_listing = re.compile(r'\.txt$')
 
 
+@pytest.mark.parametrize('pattern', [test_pattern_file_listing, ('.txt',)], ids=['regex', 'suffixes'])
 @pytest.mark.parametrize('recursive', [True, False], ids=['recursive', 'non recursive'])
-def test_file_listing(recursive):
+def test_file_listing(recursive, pattern):
     with tempfile.TemporaryDirectory() as tmpdirpath:
 
         # create test structure
-        # we will have a file 1 under root and a file 2 under a subfolder called "subfolder"
+        # we will have a file 1 under root, a file 2 under a subfolder called "subfolder"
+        # and a file 3 under a hidden subfolder called ".hidden" (hidden folders are not skipped)
         filename1, subfoldername, filename2 = 'foo.txt', 'subfolder', 'bar.txt'
+        hiddenfoldername, filename3 = '.hidden', 'baz.txt'
         with open(os.path.join(tmpdirpath, filename1), mode='w', encoding='utf-8') as fh:
             fh.write('test')
-        os.mkdir(os.path.join(tmpdirpath, subfoldername))
-        with open(os.path.join(tmpdirpath, subfoldername, filename2), mode='w', encoding='utf-8') as fh:
-            fh.write('test')
+        for foldername, filename in ((subfoldername, filename2), (hiddenfoldername, filename3)):
+            os.mkdir(os.path.join(tmpdirpath, foldername))
+            with open(os.path.join(tmpdirpath, foldername, filename), mode='w', encoding='utf-8') as fh:
+                fh.write('test')
 
         # list paths
-        filepaths = FileOperations.list_files(folder=tmpdirpath, recursive=recursive, pattern=test_pattern_file_listing)
-        nb_items_expected = 2 if recursive else 1
+        filepaths = FileOperations.list_files(folder=tmpdirpath, recursive=recursive, pattern=pattern)
+        assert sorted(FileOperations.iter_files(folder=tmpdirpath, recursive=recursive, pattern=pattern)) == sorted(filepaths)
+        nb_items_expected = 3 if recursive else 1
         assert len(filepaths) == nb_items_expected
 
         # check paths integrity
@@ -76,6 +97,37 @@ def test_file_listing(recursive):
         assert path_obj.parent.name == subfoldername
         assert path_obj.parent.parent.name == Path(tmpdirpath).name
 
+        # check file 3 is present
+        assert any(Path(f).name == filename3 and Path(f).parent.name == hiddenfoldername for f in filepaths)
+
+
+def test_file_listing_recursive_same_as_walk(monkeypatch, tmp_path):
+    # create test structure with nested subfolders
+    for relpath in ('a.txt', 'sub1/b.txt', 'sub1/subsub/c.txt', 'sub2/d.txt', 'sub3/e.txt'):
+        filepath = tmp_path / relpath
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text('test', encoding='utf-8')
+
+    # same files in the same order as `os.walk`
+    expected = [os.path.join(root, f) for root, _, files in os.walk(tmp_path) for f in files]
+    assert FileOperations.list_files(folder=str(tmp_path), pattern=('.txt',), recursive=True) == expected
+
+    # a missing folder is ignored (no files)
+    assert FileOperations.list_files(folder=str(tmp_path / 'missing'), pattern=('.txt',), recursive=True) == []
+
+    # a folder that cannot be read is skipped
+    unreadable = str(tmp_path / 'sub2')
+    scandir = os.scandir
+
+    def scandir_unreadable(path):
+        if os.fspath(path) == unreadable:
+            raise PermissionError(f'Permission denied: {path}')
+        return scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', scandir_unreadable)
+    filepaths = FileOperations.list_files(folder=str(tmp_path), pattern=('.txt',), recursive=True)
+    assert filepaths == [f for f in expected if Path(f).parent.name != 'sub2']
+
 
 # -
 
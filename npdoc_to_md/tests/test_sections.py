@@ -33,3 +33,42 @@ from npdoc_to_md.sections import SectionsFinder
                                                         None)])
 def test_finding_sections_from_lines(line, next_line, expected):
     assert SectionsFinder._find_from_lines(line=line, next_line=next_line) == expected
+
+
+def test_sections_finder_from_obj():
+    def foo():
+        """
+        A dummy function
+        """
+        pass
+
+    sf = SectionsFinder.from_obj(foo)
+    assert sf.py_obj is foo
+    # same instance for the same object and parameters
+    assert SectionsFinder.from_obj(foo) is sf
+    assert SectionsFinder.from_obj(foo, ignore_custom_section_warning=True) is not sf
+    # unhashable objects are not cached but still work
+    assert SectionsFinder.from_obj([]).doc is not None
+
+
+def test_sections_finder_from_obj_warnings(recwarn):
+    def foo():
+        """
+        A dummy function
+
+        My custom section
+        -----------------
+        It works!
+        """
+        pass
+
+    # the warning of numpydoc for the custom section is emitted for every call even
+    # though the instance is cached
+    for _ in range(2):
+        with pytest.warns(UserWarning, match='Unknown section'):
+            SectionsFinder.from_obj(foo)
+    # but never when it is ignored
+    recwarn.clear()
+    for _ in range(2):
+        SectionsFinder.from_obj(foo, ignore_custom_section_warning=True)
+    assert not [w for w in recwarn if 'Unknown section' in str(w.message)]